@@ -1,25 +1,47 @@
 """Album card generator for Navidrome."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-# High-level Python API
-from cardgen.api import (
-    create_card,
-    create_card_from_album,
-    render_cards_to_pdf,
-)
-from cardgen.api.navidrome import NavidromeClient
-from cardgen.api.models import Album, Track
-from cardgen.config import Theme, load_config
-from cardgen.design.cards.jcard_4panel import JCard4Panel
-from cardgen.design.cards.jcard_5panel import JCard5Panel
-from cardgen.utils.album_art import AlbumArt
+if TYPE_CHECKING:
+    from cardgen.api import (
+        create_card,
+        create_card_from_album,
+        render_cards_to_pdf,
+        render_cards_to_pdfs,
+    )
+    from cardgen.api.models import Album, Track
+    from cardgen.api.navidrome import NavidromeClient
+    from cardgen.config import Theme, load_config
+    from cardgen.design.cards.jcard_4panel import JCard4Panel
+    from cardgen.design.cards.jcard_5panel import JCard5Panel
+    from cardgen.utils.album_art import AlbumArt
+
+# High-level Python API, imported on first access (PEP 562) so importing the
+# package doesn't load requests, PIL and every section module up front
+_LAZY_IMPORTS = {
+    "create_card": "cardgen.api.builder",
+    "create_card_from_album": "cardgen.api.builder",
+    "render_cards_to_pdf": "cardgen.api.builder",
+    "render_cards_to_pdfs": "cardgen.api.builder",
+    "NavidromeClient": "cardgen.api.navidrome",
+    "Album": "cardgen.api.models",
+    "Track": "cardgen.api.models",
+    "Theme": "cardgen.config",
+    "load_config": "cardgen.config",
+    "JCard4Panel": "cardgen.design.cards.jcard_4panel",
+    "JCard5Panel": "cardgen.design.cards.jcard_5panel",
+    "AlbumArt": "cardgen.utils.album_art",
+}
 
 __all__ = [
     "Theme",
     "create_card",
     "create_card_from_album",
     "render_cards_to_pdf",
+    "render_cards_to_pdfs",
     "load_config",
     "NavidromeClient",
     "Album",
@@ -28,3 +50,13 @@ __all__ = [
     "JCard5Panel",
     "AlbumArt",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,12 +1,31 @@
 """API clients for music servers."""
 
-from cardgen.api.builder import (
-    create_card,
-    create_card_from_album,
-    render_cards_to_pdf,
-)
-from cardgen.api.models import Album, Playlist, Track
-from cardgen.api.navidrome import NavidromeClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cardgen.api.builder import (
+        create_card,
+        create_card_from_album,
+        render_cards_to_pdf,
+        render_cards_to_pdfs,
+    )
+    from cardgen.api.models import Album, Playlist, Track
+    from cardgen.api.navidrome import NavidromeClient
+
+# Imported on first access (PEP 562): the data models are needed by every
+# card module, the Navidrome client and builder (requests, PIL, rendering)
+# only when actually used
+_LAZY_IMPORTS = {
+    "Album": ".models",
+    "Playlist": ".models",
+    "Track": ".models",
+    "NavidromeClient": ".navidrome",
+    "create_card": ".builder",
+    "create_card_from_album": ".builder",
+    "render_cards_to_pdf": ".builder",
+    "render_cards_to_pdfs": ".builder",
+}
 
 __all__ = [
     "Album",
@@ -16,4 +35,15 @@ __all__ = [
     "create_card",
     "create_card_from_album",
     "render_cards_to_pdf",
+    "render_cards_to_pdfs",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import API names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
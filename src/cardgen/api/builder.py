@@ -1,12 +1,14 @@
 """High-level API for programmatic card creation."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Type
 
 from cardgen.api.models import Album
 from cardgen.api.navidrome import NavidromeClient
-from cardgen.config import Config, Theme
+from cardgen.config import Config, Theme, format_output_name
 from cardgen.design import Card
 from cardgen.fonts import register_fonts, register_google_font
 from cardgen.render import PDFRenderer
@@ -15,6 +17,26 @@ from cardgen.utils.album_art import AlbumArt
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _resolve_google_font(family: str, weight: int) -> str | None:
+    """
+    Register a Google Font once per (family, weight) and remember the result.
+
+    Batches build many cards from the same theme; caching here skips the
+    repeated registration check and, when a download fails, avoids retrying
+    it for every album.
+
+    Args:
+        family: Google Font family name.
+        weight: Font weight.
+
+    Returns:
+        Registered font name, or None if registration failed.
+    """
+    logger.info(f"Registering Google Font: {family} (weight {weight})")
+    return register_google_font(family, weight)
+
+
 def create_card(
     url: str,
     config: Config,
@@ -149,16 +171,14 @@ def create_card_from_album(
     theme_updates = {}
     register_fonts()
     if theme.title_google_font:
-        logger.info(f"Registering Google Font: {theme.title_google_font} (weight {theme.title_font_weight})")
-        font_name = register_google_font(theme.title_google_font, theme.title_font_weight)
+        font_name = _resolve_google_font(theme.title_google_font, theme.title_font_weight)
         if font_name:
             theme_updates["title_font"] = font_name
         else:
             theme_updates["title_font"] = f"{theme.font_family}-Bold"
 
     if theme.artist_google_font:
-        logger.info(f"Registering Google Font: {theme.artist_google_font} (weight {theme.artist_font_weight})")
-        font_name = register_google_font(theme.artist_google_font, theme.artist_font_weight)
+        font_name = _resolve_google_font(theme.artist_google_font, theme.artist_font_weight)
         if font_name:
             theme_updates["artist_font"] = font_name
         else:
@@ -249,6 +269,99 @@ def render_cards_to_pdf(
         page_size=page_size,
     )
 
+    # Fetch distinct label logos concurrently instead of one per card mid-render
+    from cardgen.design.sections.cover import prefetch_label_logos
+
+    prefetch_label_logos(card.theme.label_logo for card in cards)
+
     renderer.render_cards(cards, output_path)
 
     logger.info(f"PDF saved to: {output_path}")
+
+
+def render_cards_to_pdfs(
+    cards: list[Card],
+    output_dir: str | Path,
+    dpi: int = 600,
+    page_size: str = "letter",
+    include_crop_marks: bool = True,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Render each card to its own PDF file, in parallel.
+
+    Cards are independent, so they are rendered on a thread pool. Each worker
+    gets its own PDFRenderer and canvas (ReportLab canvases are not thread-safe);
+    the heavy image work in Pillow releases the GIL, so threads are enough.
+    Cards may share an AlbumArt (e.g. one album in several layouts); its
+    caches are locked.
+
+    Files are named "{artist} - {album}.pdf" inside output_dir. Cards that
+    would get the same name (e.g. the same album in two layouts) are given
+    " (2)", " (3)", ... suffixes, so no two workers write the same file.
+
+    Args:
+        cards: List of Card objects to render.
+        output_dir: Directory to write the PDF files to (created if missing).
+        dpi: DPI for image rendering (300-1200). Default: 600.
+        page_size: Page size for printing. Default: "letter".
+        include_crop_marks: Whether to include crop marks and fold guides. Default: True.
+        max_workers: Maximum number of worker threads. Default: ThreadPoolExecutor's default.
+
+    Returns:
+        List of output paths, in the same order as cards.
+
+    Example:
+        ```python
+        from cardgen import create_card, render_cards_to_pdfs, load_config
+        from cardgen.design import JCard5Panel
+
+        config = load_config()
+        cards = [create_card(url, config, JCard5Panel) for url in album_urls]
+
+        paths = render_cards_to_pdfs(cards, "out/", dpi=600)
+        ```
+    """
+    if not cards:
+        raise ValueError("No cards provided to render")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Name each card's file, de-duplicating names that collide (compared
+    # case-insensitively, since some filesystems are)
+    output_paths: list[Path] = []
+    used_names: set[str] = set()
+    for card in cards:
+        name = format_output_name("{artist} - {album}.pdf", card.album.artist, card.album.title, card.album.year)
+        candidate = name
+        copy_number = 2
+        while candidate.casefold() in used_names:
+            candidate = f"{Path(name).stem} ({copy_number}){Path(name).suffix}"
+            copy_number += 1
+        used_names.add(candidate.casefold())
+        output_paths.append(output_dir / candidate)
+
+    logger.info(
+        f"Rendering {len(cards)} card(s) to separate PDFs at {dpi} DPI "
+        f"on {page_size} page with {'crop marks' if include_crop_marks else 'no crop marks'}..."
+    )
+
+    def render_one(card: Card, output_path: Path) -> Path:
+        renderer = PDFRenderer(
+            dpi=dpi,
+            include_crop_marks=include_crop_marks,
+            page_size=page_size,
+        )
+        renderer.render_cards([card], output_path)
+        logger.info(f"PDF saved to: {output_path}")
+        return output_path
+
+    # Load each distinct label logo once up front, so workers sharing a
+    # label don't all download it at the same time
+    from cardgen.design.sections.cover import prefetch_label_logos
+
+    prefetch_label_logos(card.theme.label_logo for card in cards)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(render_one, cards, output_paths))
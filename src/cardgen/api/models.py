@@ -1,6 +1,6 @@
 """Data models for albums, tracks, and playlists."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -41,6 +41,43 @@ class Album:
     composer: str | None = None
     rym_descriptors: list[str] | None = None  # RateYourMusic descriptors from custom tags
     show_dolby_logo: bool = False  # Whether to show Dolby NR logo on spine
+    # Signature of the last tape side assignment (tape length plus each
+    # track's identity, duration and assigned side) and its side capacity,
+    # see assign_tape_sides()
+    _tape_sides: tuple[tuple[object, ...], int] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _tape_sides_signature(self, tape_length_minutes: int) -> tuple[object, ...]:
+        """Key identifying the tracks and sides a tape side assignment was made for."""
+        return (tape_length_minutes, *((id(track), track.duration, track.side) for track in self.tracks))
+
+    def assign_tape_sides(self, tape_length_minutes: int = 90) -> int:
+        """
+        Assign tape sides to this album's tracks, reusing the previous assignment.
+
+        Rendering several card layouts for the same album would otherwise repeat
+        the split for every card. The previous assignment is reused only while
+        the tape length and the tracks (same objects, durations and sides) are
+        unchanged; adding, replacing or editing tracks reassigns them.
+
+        Args:
+            tape_length_minutes: Total tape length in minutes (default: 90 for C90 cassette).
+
+        Returns:
+            Side capacity in seconds (tape_length_minutes * 60 / 2).
+
+        Raises:
+            ValueError: If any single track exceeds side capacity or total duration exceeds tape capacity.
+        """
+        cached = self._tape_sides
+        if cached is not None and cached[0] == self._tape_sides_signature(tape_length_minutes):
+            return cached[1]
+
+        # Imported here: cardgen.utils.tape depends on these models
+        from cardgen.utils.tape import assign_tape_sides
+
+        side_capacity_seconds = assign_tape_sides(self.tracks, tape_length_minutes)
+        self._tape_sides = (self._tape_sides_signature(tape_length_minutes), side_capacity_seconds)
+        return side_capacity_seconds
 
     def total_duration(self) -> int:
         """
@@ -67,6 +104,20 @@ class Album:
             return f"{hours}:{minutes:02d}:{seconds:02d}"
         return f"{minutes}:{seconds:02d}"
 
+    @property
+    def spine_text(self) -> str:
+        """
+        Spine text: artist, title and year (if known) joined with bullets.
+
+        Built on each access, so edits to artist, title or year show up.
+
+        Returns:
+            Combined spine text string.
+        """
+        if self.year:
+            return f"{self.artist} • {self.title} • {self.year}"
+        return f"{self.artist} • {self.title}"
+
 
 @dataclass
 class Playlist:
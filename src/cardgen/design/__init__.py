@@ -1,7 +1,11 @@
 """Design system for card layouts and themes."""
 
+from typing import TYPE_CHECKING, Any
+
 from cardgen.design.base import Card, CardSection
-from cardgen.design.cards import JCard4Panel, JCard5Panel
+
+if TYPE_CHECKING:
+    from cardgen.design.cards import JCard4Panel, JCard5Panel
 
 __all__ = [
     "Card",
@@ -9,3 +13,14 @@ __all__ = [
     "JCard4Panel",
     "JCard5Panel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Forward card classes from cardgen.design.cards without importing them eagerly."""
+    if name in ("JCard4Panel", "JCard5Panel"):
+        from cardgen.design import cards
+
+        value = getattr(cards, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
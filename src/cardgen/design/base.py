@@ -1,6 +1,7 @@
 """Base abstractions for card layouts and themes."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -12,9 +13,14 @@ if TYPE_CHECKING:
     from cardgen.config import Theme
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RendererContext:
-    """Context passed to section renderers."""
+    """
+    Context passed to section renderers.
+
+    Immutable: the renderer builds one per card and derives each section's
+    context from it with dataclasses.replace().
+    """
 
     canvas: "canvas.Canvas"  # type: ignore
     x: float  # X position in points
@@ -29,6 +35,8 @@ class RendererContext:
 class CardSection(ABC):
     """Base class for card sections."""
 
+    __slots__ = ("name", "dimensions")
+
     def __init__(self, name: str, dimensions: Dimensions) -> None:
         """
         Initialize card section.
@@ -54,6 +62,8 @@ class CardSection(ABC):
 class Card(ABC):
     """Abstract base class for card layouts."""
 
+    __slots__ = ("album", "theme", "tape_length_minutes")
+
     def __init__(self, album: Album, theme: "Theme", tape_length_minutes: int = 90) -> None:  # type: ignore
         """
         Initialize card with album data and theme.
@@ -88,11 +98,11 @@ class Card(ABC):
         pass
 
     @abstractmethod
-    def get_fold_lines(self) -> list[float]:
+    def get_fold_lines(self) -> Sequence[float]:
         """
         Get x-coordinates of fold lines (in inches from left edge).
 
         Returns:
-            List of x-coordinates for fold lines.
+            Read-only sequence of x-coordinates for fold lines.
         """
         pass
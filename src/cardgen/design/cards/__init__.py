@@ -1,7 +1,29 @@
 """Card layout implementations."""
 
-from cardgen.design.cards.jcard import JCard
-from cardgen.design.cards.jcard_4panel import JCard4Panel
-from cardgen.design.cards.jcard_5panel import JCard5Panel
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cardgen.design.cards.jcard import JCard
+    from cardgen.design.cards.jcard_4panel import JCard4Panel
+    from cardgen.design.cards.jcard_5panel import JCard5Panel
+
+# Card classes are imported on first access (PEP 562) so importing the package
+# doesn't load every layout module
+_LAZY_IMPORTS = {
+    "JCard": ".jcard",
+    "JCard4Panel": ".jcard_4panel",
+    "JCard5Panel": ".jcard_5panel",
+}
 
 __all__ = ["JCard", "JCard4Panel", "JCard5Panel"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import card classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
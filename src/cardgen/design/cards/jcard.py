@@ -1,5 +1,9 @@
 """Generic j-card layout with configurable panels."""
 
+from collections.abc import Sequence
+from dataclasses import replace
+from itertools import accumulate
+
 from cardgen.api.models import Album
 from cardgen.config import Theme
 from cardgen.design.base import Card, CardSection
@@ -13,6 +17,8 @@ class JCard(Card):
     Panels are laid out left-to-right. Fold lines are automatically generated between panels.
     """
 
+    __slots__ = ("panels", "_fold_lines", "_total_width")
+
     def __init__(
         self,
         album: Album,
@@ -36,13 +42,21 @@ class JCard(Card):
         self._layout_panels()
 
     def _layout_panels(self) -> None:
-        """Layout panels left-to-right, updating their x positions."""
-        x_offset = 0.0
-        for panel in self.panels:
-            # Update panel position
-            panel.dimensions.x = x_offset
-            panel.dimensions.y = 0.0
-            x_offset += panel.dimensions.width
+        """
+        Layout panels left-to-right, updating their x positions.
+
+        Also caches the fold lines and total width, which fall out of the same
+        running sum of panel widths.
+        """
+        # offsets[i] is the left edge of panel i; offsets[-1] is the total width
+        offsets = [0.0, *accumulate(panel.dimensions.width for panel in self.panels)]
+        for panel, x_offset in zip(self.panels, offsets):
+            # Reposition panel (Dimensions are immutable, so swap in a moved copy)
+            panel.dimensions = replace(panel.dimensions, x=x_offset, y=0.0)
+
+        self._total_width = offsets[-1]
+        # Fold line after each panel except the last
+        self._fold_lines = tuple(offsets[1:-1])
 
     def get_dimensions(self) -> Dimensions:
         """
@@ -51,8 +65,7 @@ class JCard(Card):
         Returns:
             Dimensions object for entire card.
         """
-        total_width = sum(panel.dimensions.width for panel in self.panels)
-        return Dimensions(width=total_width, height=JCARD_HEIGHT)
+        return Dimensions(width=self._total_width, height=JCARD_HEIGHT)
 
     def get_sections(self) -> list[CardSection]:
         """
@@ -63,19 +76,11 @@ class JCard(Card):
         """
         return self.panels
 
-    def get_fold_lines(self) -> list[float]:
+    def get_fold_lines(self) -> Sequence[float]:
         """
         Get x-coordinates of fold lines (in inches from left edge).
 
         Returns:
-            List of x-coordinates for fold lines (between each panel).
+            Tuple of x-coordinates for fold lines (between each panel).
         """
-        fold_lines = []
-        x_offset = 0.0
-
-        # Add fold line after each panel except the last
-        for panel in self.panels[:-1]:
-            x_offset += panel.dimensions.width
-            fold_lines.append(x_offset)
-
-        return fold_lines
+        return self._fold_lines
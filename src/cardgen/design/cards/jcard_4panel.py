@@ -1,21 +1,48 @@
 """4-panel cassette j-card layout implementation."""
 
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
 from cardgen.api.models import Album
 from cardgen.config import Theme
 from cardgen.design.base import Card, CardSection
-from cardgen.design.sections import CoverSection, MetadataSection, SpineSection, TracklistSection
-from cardgen.design.sections.descriptors import DescriptorsSection
-from cardgen.utils.album_art import AlbumArt
 from cardgen.utils.dimensions import (
-    JCARD_BACK_WIDTH,
-    JCARD_HEIGHT,
-    JCARD_PANEL_WIDTH,
-    JCARD_SPINE_WIDTH,
+    JCARD_FRONT_X,
+    JCARD_INSIDE_X,
+    JCARD_SPINE_X,
     Dimensions,
     get_jcard_4_panel_dimensions,
     get_panel_dimensions,
 )
-from cardgen.utils.tape import assign_tape_sides
+
+if TYPE_CHECKING:
+    from cardgen.utils.album_art import AlbumArt
+
+# Inside panel - Split vertically: 70% tracklist, 30% descriptors.
+# The layout is fixed, so the split is computed once at import time.
+_INSIDE_PANEL = get_panel_dimensions()["inside"]
+# Tracklist at top: 70% of height, positioned above descriptors
+_TRACKLIST_DIMS = Dimensions(
+    width=_INSIDE_PANEL.width,
+    height=_INSIDE_PANEL.height * 0.7,
+    x=_INSIDE_PANEL.x,
+    y=_INSIDE_PANEL.y + (_INSIDE_PANEL.height * 0.3),
+)
+# Descriptors at bottom: 30% of height
+_DESCRIPTORS_DIMS = Dimensions(
+    width=_INSIDE_PANEL.width,
+    height=_INSIDE_PANEL.height * 0.3,
+    x=_INSIDE_PANEL.x,
+    y=_INSIDE_PANEL.y,  # At bottom of panel
+)
+
+# Fold lines between each panel
+# Back (0.667") | Spine (0.5") | Front (2.5") | Inside (2.5")
+_FOLD_LINES = (
+    JCARD_SPINE_X,  # Between back and spine
+    JCARD_FRONT_X,  # Between spine and front
+    JCARD_INSIDE_X,  # Between front and inside
+)
 
 
 class JCard4Panel(Card):
@@ -26,7 +53,9 @@ class JCard4Panel(Card):
     When folded, back wraps around outside back, front is on outside front, inside opens to the right.
     """
 
-    def __init__(self, album: Album, theme: Theme, album_art: AlbumArt | None, tape_length_minutes: int = 90) -> None:
+    __slots__ = ("album_art", "panels", "side_capacity", "_sections")
+
+    def __init__(self, album: Album, theme: Theme, album_art: "AlbumArt | None", tape_length_minutes: int = 90) -> None:
         """
         Initialize 4-panel j-card.
 
@@ -39,9 +68,10 @@ class JCard4Panel(Card):
         super().__init__(album, theme, tape_length_minutes)
         self.album_art = album_art
         self.panels = get_panel_dimensions()
+        self._sections: list[CardSection] | None = None
 
-        # Assign tracks to tape sides (modifies tracks in place)
-        self.side_capacity = assign_tape_sides(album.tracks, tape_length_minutes)
+        # Assign tracks to tape sides (modifies tracks in place, reused across cards)
+        self.side_capacity = album.assign_tape_sides(tape_length_minutes)
 
     def get_dimensions(self) -> Dimensions:
         """
@@ -56,83 +86,64 @@ class JCard4Panel(Card):
         """
         Get all sections that make up this card.
 
+        Sections are built on first call and reused afterwards; the album,
+        theme and artwork are fixed for the lifetime of the card.
+
         Returns:
             List of CardSection objects with content specifications.
         """
-        sections: list[CardSection] = []
-
-        # Inside panel - Split vertically: 70% tracklist, 30% descriptors
-        inside_panel = self.panels["inside"]
-
-        # Tracklist at top: 70% of height
-        tracklist_height = inside_panel.height * 0.7
-        tracklist_y = inside_panel.y + (inside_panel.height * 0.3)  # Positioned above descriptors
+        if self._sections is None:
+            self._sections = self._build_sections()
+        return self._sections
+
+    def _build_sections(self) -> list[CardSection]:
+        """Build the card's sections (uncached, see get_sections())."""
+        # Section modules pull in PIL and ReportLab; defer until layout time
+        from cardgen.design.sections import (
+            CoverSection,
+            DescriptorsSection,
+            MetadataSection,
+            SpineSection,
+            TracklistSection,
+        )
 
-        sections.append(
+        return [
             TracklistSection(
                 name="inside_tracklist",
-                dimensions=Dimensions(
-                    width=inside_panel.width,
-                    height=tracklist_height,
-                    x=inside_panel.x,
-                    y=tracklist_y
-                ),
+                dimensions=_TRACKLIST_DIMS,
                 tracks=self.album.tracks,
                 side_capacity=self.side_capacity,
                 title="Tracklist",
                 track_title_overflow=self.theme.track_title_overflow,
                 min_track_title_char_spacing=self.theme.min_track_title_char_spacing,
-            )
-        )
-
-        # Descriptors at bottom: 30% of height
-        descriptors_height = inside_panel.height * 0.3
-        descriptors_y = inside_panel.y  # At bottom of panel
+            ),
 
-        sections.append(
             DescriptorsSection(
                 name="inside_descriptors",
-                dimensions=Dimensions(
-                    width=inside_panel.width,
-                    height=descriptors_height,
-                    x=inside_panel.x,
-                    y=descriptors_y
-                ),
+                dimensions=_DESCRIPTORS_DIMS,
                 album=self.album,
                 font_size=10.0,
                 padding_override=0.125,
-            )
-        )
+            ),
 
-        sections.append(
             MetadataSection(
                 name="back",
                 dimensions=self.panels["back"],
                 album=self.album,
                 font_size=9.0,  # Increased from 5.0, fits better than 10.0
                 padding_override=1/16
-            )
-        )
-
-        # Spine panel - Artist, Title, Year (vertical text, all bold)
-        spine_items: list[str] = []
-        spine_items.append(self.album.artist)
-        spine_items.append(self.album.title)
-        if self.album.year:
-            spine_items.append(str(self.album.year))
+            ),
 
-        sections.append(
+            # Spine panel - Artist, Title, Year (vertical text, all bold)
             SpineSection(
                 name="spine",
                 dimensions=self.panels["spine"],
-                text_lines=spine_items,
+                text=self.album.spine_text,
                 album_art=self.album_art,
                 show_dolby_logo=self.album.show_dolby_logo,
-            )
-        )
+            ),
 
-        # Front panel - Album art, Title, Artist
-        sections.append(
+            # Front panel - Album art, Title, Artist
             CoverSection(
                 name="front",
                 dimensions=self.panels["front"],
@@ -140,22 +151,14 @@ class JCard4Panel(Card):
                 title=self.album.title,
                 artist=self.album.artist,
                 show_dolby_logo=self.album.show_dolby_logo,
-            )
-        )
-
-        return sections
+            ),
+        ]
 
-    def get_fold_lines(self) -> list[float]:
+    def get_fold_lines(self) -> Sequence[float]:
         """
         Get x-coordinates of fold lines (in inches from left edge).
 
         Returns:
-            List of x-coordinates for fold lines.
+            Tuple of x-coordinates for fold lines.
         """
-        # Fold lines between each panel
-        # Back (1.0") | Spine (0.5") | Front (2.5") | Inside (2.5")
-        return [
-            JCARD_BACK_WIDTH,  # Between back and spine
-            JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH,  # Between spine and front
-            JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH,  # Between front and inside
-        ]
+        return _FOLD_LINES
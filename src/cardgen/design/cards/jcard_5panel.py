@@ -1,22 +1,57 @@
 """5-panel cassette j-card layout implementation."""
 
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
 from cardgen.api.models import Album
 from cardgen.config import Theme
 from cardgen.design.base import Card, CardSection
-from cardgen.design.sections import CoverSection, MetadataSection, SpineSection, TracklistSection
-from cardgen.design.sections.descriptors import DescriptorsSection
-from cardgen.design.sections.genre_tree import GenreTreeSection
-from cardgen.utils.album_art import AlbumArt
 from cardgen.utils.dimensions import (
     JCARD_5_PANEL_HEIGHT,
     JCARD_5_PANEL_WIDTH,
     JCARD_BACK_WIDTH,
+    JCARD_FRONT_X,
+    JCARD_GENRE_X,
     JCARD_HEIGHT,
+    JCARD_INSIDE_X,
     JCARD_PANEL_WIDTH,
     JCARD_SPINE_WIDTH,
+    JCARD_SPINE_X,
     Dimensions,
 )
-from cardgen.utils.tape import assign_tape_sides
+
+if TYPE_CHECKING:
+    from cardgen.utils.album_art import AlbumArt
+
+# The layout is fixed, so every card shares these (immutable) Dimensions
+_CARD_DIMS = Dimensions(width=JCARD_5_PANEL_WIDTH, height=JCARD_5_PANEL_HEIGHT)
+_BACK_DIMS = Dimensions(width=JCARD_BACK_WIDTH, height=JCARD_HEIGHT, x=0.0, y=0.0)
+_SPINE_DIMS = Dimensions(width=JCARD_SPINE_WIDTH, height=JCARD_HEIGHT, x=JCARD_SPINE_X, y=0.0)
+_FRONT_DIMS = Dimensions(width=JCARD_PANEL_WIDTH, height=JCARD_HEIGHT, x=JCARD_FRONT_X, y=0.0)
+_INSIDE_DIMS = Dimensions(width=JCARD_PANEL_WIDTH, height=JCARD_HEIGHT, x=JCARD_INSIDE_X, y=0.0)
+# Panel 5 genre tree: top 30% of height = 1.2", positioned at y=2.8"
+_GENRE_TREE_DIMS = Dimensions(
+    width=JCARD_PANEL_WIDTH,
+    height=JCARD_HEIGHT * 0.3,
+    x=JCARD_GENRE_X,
+    y=JCARD_HEIGHT * 0.7,  # 70% from bottom = top 30%
+)
+# Panel 5 descriptors below genre tree: 30% of height = 1.2", positioned at y=1.6"
+_DESCRIPTORS_DIMS = Dimensions(
+    width=JCARD_PANEL_WIDTH,
+    height=JCARD_HEIGHT * 0.3,
+    x=JCARD_GENRE_X,
+    y=JCARD_HEIGHT * 0.4,  # 40% from bottom
+)
+
+# Fold lines between each panel
+# Back (0.667") | Spine (0.5") | Front (2.5") | Inside (2.5") | Genre/Descriptors (2.5")
+_FOLD_LINES = (
+    JCARD_SPINE_X,  # Between back and spine
+    JCARD_FRONT_X,  # Between spine and front
+    JCARD_INSIDE_X,  # Between front and inside
+    JCARD_GENRE_X,  # Between inside and genre panel
+)
 
 
 class JCard5Panel(Card):
@@ -27,7 +62,9 @@ class JCard5Panel(Card):
     When folded, back wraps around outside back, front is on outside front, inside opens to reveal genre panel.
     """
 
-    def __init__(self, album: Album, theme: Theme, album_art: AlbumArt | None, tape_length_minutes: int = 90) -> None:
+    __slots__ = ("album_art", "side_capacity", "_sections")
+
+    def __init__(self, album: Album, theme: Theme, album_art: "AlbumArt | None", tape_length_minutes: int = 90) -> None:
         """
         Initialize 5-panel j-card.
 
@@ -39,9 +76,10 @@ class JCard5Panel(Card):
         """
         super().__init__(album, theme, tape_length_minutes)
         self.album_art = album_art
+        self._sections: list[CardSection] | None = None
 
-        # Assign tracks to tape sides (modifies tracks in place)
-        self.side_capacity = assign_tape_sides(album.tracks, tape_length_minutes)
+        # Assign tracks to tape sides (modifies tracks in place, reused across cards)
+        self.side_capacity = album.assign_tape_sides(tape_length_minutes)
 
     def get_dimensions(self) -> Dimensions:
         """
@@ -50,153 +88,99 @@ class JCard5Panel(Card):
         Returns:
             Dimensions object for entire card.
         """
-        return Dimensions(width=JCARD_5_PANEL_WIDTH, height=JCARD_5_PANEL_HEIGHT)
+        return _CARD_DIMS
 
     def get_sections(self) -> list[CardSection]:
         """
         Get all sections that make up this card.
 
+        Sections are built on first call and reused afterwards; the album,
+        theme and artwork are fixed for the lifetime of the card.
+
         Returns:
             List of CardSection objects with content specifications.
         """
-        sections: list[CardSection] = []
-
-        # Calculate x positions for each panel
-        panel_1_x = 0.0  # Back
-        panel_2_x = JCARD_BACK_WIDTH  # Spine
-        panel_3_x = JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH  # Front
-        panel_4_x = JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH  # Inside
-        panel_5_x = JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH + JCARD_PANEL_WIDTH  # Genre/Descriptors
+        if self._sections is None:
+            self._sections = self._build_sections()
+        return self._sections
+
+    def _build_sections(self) -> list[CardSection]:
+        """Build the card's sections (uncached, see get_sections())."""
+        # Section modules pull in PIL and ReportLab; defer until layout time
+        from cardgen.design.sections import (
+            CoverSection,
+            DescriptorsSection,
+            GenreTreeSection,
+            MetadataSection,
+            SpineSection,
+            TracklistSection,
+        )
 
-        # Panel 1: Back (Metadata)
-        sections.append(
+        return [
+            # Panel 1: Back (Metadata)
             MetadataSection(
                 name="back",
-                dimensions=Dimensions(
-                    width=JCARD_BACK_WIDTH,
-                    height=JCARD_HEIGHT,
-                    x=panel_1_x,
-                    y=0.0
-                ),
+                dimensions=_BACK_DIMS,
                 album=self.album,
                 font_size=9.0,
                 padding_override=1/16
-            )
-        )
-
-        # Panel 2: Spine (Artist, Title, Year - all bold)
-        spine_items: list[str] = []
-        spine_items.append(self.album.artist)
-        spine_items.append(self.album.title)
-        if self.album.year:
-            spine_items.append(str(self.album.year))
+            ),
 
-        sections.append(
+            # Panel 2: Spine (Artist, Title, Year - all bold)
             SpineSection(
                 name="spine",
-                dimensions=Dimensions(
-                    width=JCARD_SPINE_WIDTH,
-                    height=JCARD_HEIGHT,
-                    x=panel_2_x,
-                    y=0.0
-                ),
-                text_lines=spine_items,
+                dimensions=_SPINE_DIMS,
+                text=self.album.spine_text,
                 album_art=self.album_art,
                 show_dolby_logo=self.album.show_dolby_logo,
-            )
-        )
+            ),
 
-        # Panel 3: Front (Cover)
-        sections.append(
+            # Panel 3: Front (Cover)
             CoverSection(
                 name="front",
-                dimensions=Dimensions(
-                    width=JCARD_PANEL_WIDTH,
-                    height=JCARD_HEIGHT,
-                    x=panel_3_x,
-                    y=0.0
-                ),
+                dimensions=_FRONT_DIMS,
                 album_art=self.album_art,
                 title=self.album.title,
                 artist=self.album.artist,
                 show_dolby_logo=self.album.show_dolby_logo,
-            )
-        )
+            ),
 
-        # Panel 4: Inside (Tracklist)
-        sections.append(
+            # Panel 4: Inside (Tracklist)
             TracklistSection(
                 name="inside",
-                dimensions=Dimensions(
-                    width=JCARD_PANEL_WIDTH,
-                    height=JCARD_HEIGHT,
-                    x=panel_4_x,
-                    y=0.0
-                ),
+                dimensions=_INSIDE_DIMS,
                 tracks=self.album.tracks,
                 side_capacity=self.side_capacity,
                 title="Tracklist",
                 track_title_overflow=self.theme.track_title_overflow,
                 min_track_title_char_spacing=self.theme.min_track_title_char_spacing,
-            )
-        )
+            ),
 
-        # Panel 5: Split vertically into Genre Tree (top 30%) and Descriptors (middle 30%), bottom 40% blank
-
-        # Genre tree at top: 30% of height = 1.2", positioned at y=2.8"
-        genre_tree_height = JCARD_HEIGHT * 0.3
-        genre_tree_y = JCARD_HEIGHT * 0.7  # 70% from bottom = top 30%
-
-        sections.append(
+            # Panel 5: Split vertically into Genre Tree (top 30%) and Descriptors (middle 30%), bottom 40% blank
             GenreTreeSection(
                 name="genre_tree",
-                dimensions=Dimensions(
-                    width=JCARD_PANEL_WIDTH,
-                    height=genre_tree_height,
-                    x=panel_5_x,
-                    y=genre_tree_y
-                ),
+                dimensions=_GENRE_TREE_DIMS,
                 album=self.album,
                 font_size=10.0,
                 padding_override=0.125,
-            )
-        )
+            ),
 
-        # Descriptors below genre tree: 30% of height = 1.2", positioned at y=1.6"
-        descriptors_height = JCARD_HEIGHT * 0.3
-        descriptors_y = JCARD_HEIGHT * 0.4  # 40% from bottom
-
-        sections.append(
             DescriptorsSection(
                 name="descriptors",
-                dimensions=Dimensions(
-                    width=JCARD_PANEL_WIDTH,
-                    height=descriptors_height,
-                    x=panel_5_x,
-                    y=descriptors_y
-                ),
+                dimensions=_DESCRIPTORS_DIMS,
                 album=self.album,
                 font_size=10.0,
                 padding_override=0.125,
-            )
-        )
-
-        # Bottom 40% of panel 5 is left blank (no section added)
+            ),
 
-        return sections
+            # Bottom 40% of panel 5 is left blank (no section added)
+        ]
 
-    def get_fold_lines(self) -> list[float]:
+    def get_fold_lines(self) -> Sequence[float]:
         """
         Get x-coordinates of fold lines (in inches from left edge).
 
         Returns:
-            List of x-coordinates for fold lines.
+            Tuple of x-coordinates for fold lines.
         """
-        # Fold lines between each panel
-        # Back (0.667") | Spine (0.5") | Front (2.5") | Inside (2.5") | Genre/Descriptors (2.5")
-        return [
-            JCARD_BACK_WIDTH,  # Between back and spine
-            JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH,  # Between spine and front
-            JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH,  # Between front and inside
-            JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH + JCARD_PANEL_WIDTH,  # Between inside and genre panel
-        ]
+        return _FOLD_LINES
@@ -2,23 +2,125 @@
 
 import io
 import logging
-import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import requests
-from reportlab.graphics import renderPDF
+from PIL import Image, UnidentifiedImageError
 from reportlab.lib.colors import Color
 from reportlab.lib.utils import ImageReader
-from svglib.svglib import svg2rlg
 
 from cardgen.design.base import CardSection, RendererContext
 from cardgen.utils.album_art import AlbumArt
-from cardgen.utils.dimensions import SAFE_MARGIN, Dimensions, inches_to_points
-from cardgen.utils.text import Line, fit_text_block
+from cardgen.utils.assets import draw_svg_asset, load_svg_drawing
+from cardgen.utils.dimensions import SAFE_MARGIN, Dimensions, inches_to_points, points_to_pixels
+from cardgen.utils.text import Line, fit_text_block, string_width
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Layout constants (points)
+_SAFE_MARGIN_PTS = inches_to_points(SAFE_MARGIN)
+_MIN_TEXT_HEIGHT = 90  # Minimum space needed for large text + padding
+_LOGO_PADDING_PTS = inches_to_points(1/16)  # Inset for the Dolby and label logos
+
+# Label logo load failures: files PIL can't identify (e.g. an HTML error
+# page), corrupt image data (verify() raises SyntaxError for some formats)
+# and I/O errors. requests.RequestException subclasses OSError, so requests
+# doesn't need to be imported just to name it.
+_LOGO_ERRORS = (UnidentifiedImageError, SyntaxError, OSError, ValueError)
+
+
+# One HTTP session per thread: logos are downloaded from the prefetch pool
+# and from render threads, and requests.Session isn't documented as thread-safe
+_thread_local = threading.local()
+
+
+def _session() -> "requests.Session":
+    """
+    This thread's HTTP session, so repeated label logo downloads reuse connections.
+
+    requests is imported here rather than at module level: most cards
+    have no label logo, or load it from a local file.
+    """
+    session: requests.Session | None = getattr(_thread_local, "session", None)
+    if session is None:
+        import requests
+
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+@lru_cache(maxsize=64)
+def _load_label_logo(src: str) -> tuple[ImageReader, float]:
+    """
+    Load and decode a label logo, once per path or URL.
+
+    Failures raise and are not cached, so a later render retries.
+
+    Args:
+        src: Local file path or http(s) URL of the logo image.
+
+    Returns:
+        Tuple of (ImageReader preserving the alpha channel, width / height aspect ratio).
+    """
+    if src.startswith(('http://', 'https://')):
+        # URL - fetch with requests
+        response = _session().get(src, timeout=10)
+        response.raise_for_status()
+        logo_bytes = response.content
+    else:
+        # Local file path
+        with open(src, 'rb') as f:
+            logo_bytes = f.read()
+
+    # Let PIL identify the format and check the data; verify() leaves the
+    # image unusable, so it is opened again to decode
+    with Image.open(io.BytesIO(logo_bytes)) as probe:
+        probe.verify()
+
+    # Decode fully now so the cached image no longer depends on the buffer
+    img: Image.Image = Image.open(io.BytesIO(logo_bytes))
+    img.load()
+    return ImageReader(img), img.width / img.height
+
+
+def prefetch_label_logos(sources: Iterable[str | None], max_workers: int = 8) -> None:
+    """
+    Load label logos into the logo cache ahead of rendering, in parallel.
+
+    Downloads otherwise happen one at a time on the rendering thread. Failures
+    are ignored here; the render retries and logs them as usual.
+
+    Args:
+        sources: Logo paths/URLs (e.g. each card's theme.label_logo); None entries are skipped.
+        max_workers: Maximum number of concurrent downloads (default: 8).
+    """
+    unique = {src for src in sources if src}
+    if len(unique) < 2:
+        # Nothing to overlap; the first render loads it
+        return
+
+    def load(src: str) -> None:
+        try:
+            _load_label_logo(src)
+        except _LOGO_ERRORS:
+            pass
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        list(executor.map(load, unique))
 
 
 class CoverSection(CardSection):
     """Front cover section with album art, title, and artist."""
 
+    __slots__ = ("album_art", "title", "artist", "show_dolby_logo", "_lines_cache")
+
     def __init__(
         self,
         name: str,
@@ -44,37 +146,45 @@ class CoverSection(CardSection):
         self.title = title
         self.artist = artist
         self.show_dolby_logo = show_dolby_logo
+        # (theme fonts and sizes, line list built for them) from the last
+        # render, stored as one tuple so readers never see a mismatched pair
+        self._lines_cache: tuple[tuple[str, str, str, int, int], list[Line]] | None = None
 
     def _build_text_lines(self, context: RendererContext) -> list[Line]:
         """
         Build Line objects for title and artist.
 
+        The list is cached and rebuilt only when the theme's fonts or sizes
+        change; fit_text_block copies lines before adjusting them, so the
+        cached list is never mutated.
+
         Args:
             context: Rendering context with font configuration.
 
         Returns:
             List of Line objects (title first, then artist).
         """
+        theme = context.theme
+        key = (
+            theme.font_family, theme.title_font, theme.artist_font,
+            theme.title_font_size, theme.artist_font_size,
+        )
+        cached = self._lines_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         lines: list[Line] = []
 
         # Determine title font (use specific font if configured, else default to Bold)
-        title_font = (
-            context.theme.title_font
-            if context.theme.title_font
-            else f"{context.theme.font_family}-Bold"
-        )
+        title_font = theme.title_font if theme.title_font else f"{theme.font_family}-Bold"
 
         # Determine artist font (use specific font if configured, else default to regular)
-        artist_font = (
-            context.theme.artist_font
-            if context.theme.artist_font
-            else context.theme.font_family
-        )
+        artist_font = theme.artist_font if theme.artist_font else theme.font_family
 
         # Title line (bold) - start at theme max font size to maximize text size
         lines.append(Line(
             text=self.title,
-            point_size=context.theme.title_font_size,  # Max font size from theme, will auto-reduce to fit
+            point_size=theme.title_font_size,  # Max font size from theme, will auto-reduce to fit
             leading_ratio=0.2,  # Spacing after title
             fixed_size=False,
             font_family=title_font
@@ -83,12 +193,13 @@ class CoverSection(CardSection):
         # Artist line (regular) - start at theme max font size to maximize text size
         lines.append(Line(
             text=self.artist,
-            point_size=context.theme.artist_font_size,  # Max font size from theme, will auto-reduce to fit
+            point_size=theme.artist_font_size,  # Max font size from theme, will auto-reduce to fit
             leading_ratio=0.2,  # No spacing after (last line)
             fixed_size=False,
             font_family=artist_font
         ))
 
+        self._lines_cache = (key, lines)
         return lines
 
     def _render_fitted_lines_centered(
@@ -110,85 +221,95 @@ class CoverSection(CardSection):
         c = context.canvas
         text_y = start_y
 
+        # Same color and center for every line
+        c.setFillColor(Color(*context.theme.effective_text_color))
+        center_x = context.x + context.width / 2
+
+        # Emit all lines in a single text object; font and horizontal scale
+        # operators are only written when they change between lines. The
+        # scale starts unknown so the first line always sets it.
+        text = c.beginText()
+        current_font = None
+        current_scale: float | None = None
+
         for i, fitted_line in enumerate(fitted_lines):
-            c.setFont(fitted_line.font_family, fitted_line.point_size)
-            c.setFillColor(Color(*context.theme.effective_text_color))
+            font = (fitted_line.font_family, fitted_line.point_size)
+            if font != current_font:
+                text.setFont(*font)
+                current_font = font
+            if fitted_line.horizontal_scale != current_scale:
+                text.setHorizScale(fitted_line.horizontal_scale * 100)
+                current_scale = fitted_line.horizontal_scale
 
             # Calculate text width with scaling
-            base_width = c.stringWidth(fitted_line.text, fitted_line.font_family, fitted_line.point_size)
+            base_width = string_width(fitted_line.text, fitted_line.font_family, fitted_line.point_size)
             scaled_width = base_width * fitted_line.horizontal_scale
 
             # Center the text
-            center_x = context.x + context.width / 2
             if i > 0:
                 text_y -= fitted_line.point_size
-            # Draw text with horizontal scaling if needed
-            if fitted_line.horizontal_scale < 1.0:
-                c.saveState()
-                c.translate(center_x - scaled_width / 2, text_y)
-                c.scale(fitted_line.horizontal_scale, 1.0)
-                c.drawString(0, 0, fitted_line.text)
-                c.restoreState()
-            else:
-                c.drawCentredString(center_x, text_y, fitted_line.text)
+            text.setTextOrigin(center_x - scaled_width / 2, text_y)
+            text.textOut(fitted_line.text)
 
             # Move down for next line
             text_y -= fitted_line.point_size * fitted_line.leading_ratio
 
+        # Horizontal scale is text state and outlives the text object; reset
+        # it so later drawString calls (which never write Tz) aren't compressed
+        if current_scale not in (None, 1.0):
+            text.setHorizScale(100)
+        c.drawText(text)
+
     def render(self, context: RendererContext) -> None:
         """Render front cover with album art using fit_text_block."""
         c = context.canvas
+        # Bind frequently used context values once
+        x, y = context.x, context.y
+        width, height = context.width, context.height
+        padding = context.padding
+        theme = context.theme
 
         # Get cover art mode and alignment from theme
-        mode = context.theme.cover_art_mode
-        align = context.theme.cover_art_align
-
-        # Reserve minimum space for text (will use all remaining space after art)
-        min_text_height = 90  # Minimum space needed for large text + padding
+        mode = theme.cover_art_mode
+        align = theme.cover_art_align
 
         if mode == "fullscale":
             # Fullscale mode: art fills full height with horizontal crop/alignment
             # Calculate art height, leaving minimum space for text
-            art_height = context.height - min_text_height
-            art_width = context.width
+            art_height = height - _MIN_TEXT_HEIGHT
+            art_width = width
 
             # Position album art at left edge, extending to top
-            art_x = context.x
-            art_y = context.y + context.height - art_height
+            art_x = x
+            art_y = y + height - art_height
 
             # Text gets all remaining space
-            text_height = context.height - art_height
+            text_height = height - art_height
 
             # Resize and crop album art with alignment
-            art_dims = Dimensions(width=art_width/72, height=art_height/72, dpi=context.dpi)
-            pixel_dims = art_dims.to_pixels()
-            processed_img = self.album_art.resize_and_crop(
-                (pixel_dims.width, pixel_dims.height), mode="fullscale", align=align
-            )
+            pixel_size = (points_to_pixels(art_width, context.dpi), points_to_pixels(art_height, context.dpi))
+            img_reader = self.album_art.get_image_reader(pixel_size, mode="fullscale", align=align)
         else:
             # Square mode (default): art is square, centered
             # Calculate square art size, leaving minimum space for text
             art_size = min(
-                context.width,  # Full width, no padding
-                context.height - min_text_height,  # Leave space for text
+                width,  # Full width, no padding
+                height - _MIN_TEXT_HEIGHT,  # Leave space for text
             )
 
             # Position album art at left edge, extending to top
-            art_x = context.x
-            art_y = context.y + context.height - art_size
+            art_x = x
+            art_y = y + height - art_size
             art_width = art_size
             art_height = art_size
 
             # Text gets all remaining space
-            text_height = context.height - art_size
+            text_height = height - art_size
 
             # Resize and crop album art
-            art_dims = Dimensions(width=art_size/72, height=art_size/72, dpi=context.dpi)
-            pixel_dims = art_dims.to_pixels()
-            processed_img = self.album_art.resize_and_crop((pixel_dims.width, pixel_dims.width), mode="square")
-
-        # Convert PIL image to ImageReader
-        img_reader = AlbumArt.pil_to_image_reader(processed_img)
+            art_px = points_to_pixels(art_size, context.dpi)
+            pixel_size = (art_px, art_px)
+            img_reader = self.album_art.get_image_reader(pixel_size, mode="square")
 
         # Draw image
         c.drawImage(
@@ -197,13 +318,15 @@ class CoverSection(CardSection):
             art_y,
             width=art_width,
             height=art_height,
-            preserveAspectRatio=True,
+            # Art is cropped to exactly the target pixels unless a fullscale
+            # image was narrower than the panel; only then does ReportLab need
+            # to fit it without stretching
+            preserveAspectRatio=img_reader.getSize() != pixel_size,
         )
 
         # Calculate available space for text (respect safe margins)
-        safe_margin_pts = inches_to_points(SAFE_MARGIN)
-        available_text_width = context.width - (context.padding * 2) - (safe_margin_pts * 2)
-        available_text_height = text_height - (context.padding * 2)
+        available_text_width = width - (padding * 2) - (_SAFE_MARGIN_PTS * 2)
+        available_text_height = text_height - (padding * 2)
 
         # Build text lines
         lines = self._build_text_lines(context)
@@ -219,62 +342,39 @@ class CoverSection(CardSection):
         )
 
         # Render fitted lines centered
-        start_y = art_y - context.padding - fitted_lines[0].point_size
+        start_y = art_y - padding - fitted_lines[0].point_size
         self._render_fitted_lines_centered(context, fitted_lines, start_y, available_text_width)
 
         # Render Dolby logo if requested
         if self.show_dolby_logo:
-            # Load the white Dolby logo SVG
-            assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
-            logo_path = os.path.join(assets_dir, 'dolby-b-full-white.svg')
-
-            if os.path.exists(logo_path):
-                drawing = svg2rlg(logo_path)
-
-                if drawing:
-                    # Calculate logo dimensions (1/3 of panel width, maintaining aspect ratio)
-                    logo_padding = inches_to_points(1/16)
-                    logo_width = context.width / 3
-                    aspect_ratio = drawing.width / drawing.height
-                    logo_height = logo_width / aspect_ratio
+            # Load the white Dolby logo SVG (parsed once, shared across renders)
+            drawing = load_svg_drawing('dolby-b-full-white.svg')
 
-                    # Scale the drawing
-                    scale_factor = logo_width / drawing.width
-                    drawing.width = logo_width
-                    drawing.height = logo_height
-                    drawing.scale(scale_factor, scale_factor)
+            if drawing:
+                # Scale to 1/3 of panel width (aspect ratio is preserved by the uniform scale)
+                scale_factor = (width / 3) / drawing.width
 
-                    # Position logo at bottom left with padding
-                    logo_x = context.x + logo_padding
-                    logo_y = context.y + logo_padding
+                # Position logo at bottom left with padding
+                logo_x = x + _LOGO_PADDING_PTS
+                logo_y = y + _LOGO_PADDING_PTS
 
-                    # Render the logo
-                    renderPDF.draw(drawing, c, logo_x, logo_y)
+                # Render the logo, scaling through the canvas transform so the
+                # shared drawing is never modified
+                c.saveState()
+                c.translate(logo_x, logo_y)
+                c.scale(scale_factor, scale_factor)
+                draw_svg_asset(c, drawing)
+                c.restoreState()
 
         # Render label logo if specified in theme
-        if context.theme.label_logo:
+        if theme.label_logo:
             try:
-                # Load logo image from path or URL
-                if context.theme.label_logo.startswith(('http://', 'https://')):
-                    # URL - fetch with requests
-                    import requests
-                    response = requests.get(context.theme.label_logo, timeout=10)
-                    response.raise_for_status()
-                    logo_bytes = response.content
-                else:
-                    # Local file path
-                    with open(context.theme.label_logo, 'rb') as f:
-                        logo_bytes = f.read()
-
-                # Load with PIL
-                from PIL import Image
-                img = Image.open(io.BytesIO(logo_bytes))
+                img_reader, aspect_ratio = _load_label_logo(theme.label_logo)
 
                 # Scale to max 35 points on largest dimension, maintain aspect ratio
-                logo_max_pts = 35
-                aspect_ratio = img.width / img.height
+                logo_max_pts = 35.0
 
-                if img.width >= img.height:
+                if aspect_ratio >= 1:
                     # Width is largest dimension
                     logo_width = logo_max_pts
                     logo_height = logo_max_pts / aspect_ratio
@@ -283,13 +383,9 @@ class CoverSection(CardSection):
                     logo_height = logo_max_pts
                     logo_width = logo_max_pts * aspect_ratio
 
-                # Convert to ImageReader for ReportLab (preserve alpha channel)
-                img_reader = ImageReader(img)
-
                 # Position at bottom right with padding
-                logo_padding = inches_to_points(1/16)  # Same padding as Dolby
-                logo_x = context.x + context.width - logo_width - logo_padding
-                logo_y = context.y + logo_padding
+                logo_x = x + width - logo_width - _LOGO_PADDING_PTS
+                logo_y = y + _LOGO_PADDING_PTS
 
                 # Draw the logo with alpha support
                 c.drawImage(
@@ -302,12 +398,6 @@ class CoverSection(CardSection):
                     preserveAspectRatio=True,
                 )
 
-            except (
-                requests.RequestException,
-                OSError,
-                Image.UnidentifiedImageError,
-                ValueError
-            ) as e:
+            except _LOGO_ERRORS as e:
                 # Log error but continue rendering
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Failed to load or render label logo '{context.theme.label_logo}': {e}")
+                logger.warning(f"Failed to load or render label logo '{theme.label_logo}': {e}")
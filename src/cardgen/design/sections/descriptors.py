@@ -4,13 +4,18 @@ from reportlab.lib.colors import Color
 
 from cardgen.api.models import Album
 from cardgen.design.base import CardSection, RendererContext
-from cardgen.utils.dimensions import Dimensions
+from cardgen.utils.dimensions import Dimensions, inches_to_points
 from cardgen.utils.text import Line, fit_text_block
 
+# Default padding for the genre panel (0.15" = 10.8 points instead of the theme's ~7.2)
+_DEFAULT_PADDING_PTS = inches_to_points(0.15)
+
 
 class DescriptorsSection(CardSection):
     """Section displaying RYM descriptors."""
 
+    __slots__ = ("album", "font_size", "padding_override", "_padding_pts", "descriptor_text", "_lines_font", "_lines")
+
     def __init__(
         self,
         name: str,
@@ -33,31 +38,50 @@ class DescriptorsSection(CardSection):
         self.album = album
         self.font_size = font_size
         self.padding_override = padding_override
+        # Custom padding if provided, otherwise the larger genre panel padding (points)
+        self._padding_pts = (
+            inches_to_points(padding_override) if padding_override is not None else _DEFAULT_PADDING_PTS
+        )
+        # Descriptors are fixed per album, so join them once
+        self.descriptor_text = (
+            "Descriptors: " + ", ".join(album.rym_descriptors) if album.rym_descriptors else ""
+        )
+        # Line list from the last render and the font it was built for
+        self._lines_font: str | None = None
+        self._lines: list[Line] = []
 
     def _build_text_lines(self, context: RendererContext) -> list[Line]:
         """
         Build Line objects for descriptors.
 
+        The list is cached per theme font family; fit_text_block copies lines
+        before adjusting them, so the cached list is never mutated.
+
         Args:
             context: Rendering context with font configuration.
 
         Returns:
             List of Line objects representing descriptors text.
         """
+        font_family = context.theme.font_family
+        if font_family == self._lines_font:
+            return self._lines
+
         lines: list[Line] = []
 
         # Add descriptors
-        if self.album.rym_descriptors:
+        if self.descriptor_text:
             # Descriptors text (can wrap and compress)
-            descriptor_text = "Descriptors: " + ", ".join(self.album.rym_descriptors)
             lines.append(Line(
-                text=descriptor_text,
+                text=self.descriptor_text,
                 point_size=self.font_size,
                 leading_ratio=0.4,
                 fixed_size=False,  # Allow size reduction
-                font_family=context.theme.font_family
+                font_family=font_family
             ))
 
+        self._lines_font = font_family
+        self._lines = lines
         return lines
 
     def _render_fitted_lines(
@@ -79,38 +103,55 @@ class DescriptorsSection(CardSection):
         c = context.canvas
         text_y = start_y
 
+        text_x = context.x + padding
+
+        # All lines share the text color; set it once
+        c.setFillColor(Color(*context.theme.effective_text_color))
+
+        # Draw every line through a single text object. Compression uses the
+        # text horizontal scale instead of a saved/scaled graphics state per
+        # line; font and scale operators are only written when they change.
+        # The scale starts unknown so the first line always sets it.
+        text = c.beginText()
+        current_font: tuple[str, float] | None = None
+        current_scale: float | None = None
+
         for fitted_line in fitted_lines:
             # Skip empty lines (spacing)
             if not fitted_line.text:
                 text_y -= fitted_line.point_size + (fitted_line.point_size * fitted_line.leading_ratio)
                 continue
 
-            c.setFillColor(Color(*context.theme.effective_text_color))
-
             # Draw descriptor text
-            c.setFont(fitted_line.font_family, fitted_line.point_size)
-            if fitted_line.horizontal_scale < 1.0:
-                c.saveState()
-                c.translate(context.x + padding, text_y)
-                c.scale(fitted_line.horizontal_scale, 1.0)
-                c.drawString(0, 0, fitted_line.text)
-                c.restoreState()
-            else:
-                c.drawString(context.x + padding, text_y, fitted_line.text)
+            font = (fitted_line.font_family, fitted_line.point_size)
+            if font != current_font:
+                text.setFont(*font)
+                current_font = font
+            scale = min(fitted_line.horizontal_scale, 1.0)
+            if scale != current_scale:
+                text.setHorizScale(scale * 100)
+                current_scale = scale
+            text.setTextOrigin(text_x, text_y)
+            text.textOut(fitted_line.text)
 
             # Move down for next line
             text_y -= fitted_line.point_size + (fitted_line.point_size * fitted_line.leading_ratio)
 
+        # Horizontal scale is text state and outlives the text object; reset
+        # it so later drawString calls (which never write Tz) aren't compressed
+        if current_scale not in (None, 1.0):
+            text.setHorizScale(100)
+        c.drawText(text)
+
     def render(self, context: RendererContext) -> None:
         """Render descriptors using fit_text_block."""
+        # If no descriptors, nothing to render
+        if not self.descriptor_text:
+            return
+
         c = context.canvas
 
-        # Use custom padding if provided, otherwise use larger padding for genre panel
-        if self.padding_override is not None:
-            padding = self.padding_override * 72  # Convert inches to points
-        else:
-            # Use larger padding for genre panel (0.15" = 10.8 points instead of default ~7.2 points)
-            padding = 0.15 * 72  # Convert inches to points
+        padding = self._padding_pts
 
         # Calculate available space
         available_height = context.height - (padding * 2)
@@ -119,10 +160,6 @@ class DescriptorsSection(CardSection):
         # Build Line objects
         lines = self._build_text_lines(context)
 
-        # If no descriptors, nothing to render
-        if not lines:
-            return
-
         # Fit all text within constraints
         # Use minimal compression and allow many splits for natural wrapping
         fitted_lines = fit_text_block(
@@ -1,18 +1,57 @@
 """Genre tree section implementation."""
 
-import re
 from reportlab.lib.colors import Color
 
 from cardgen.api.models import Album
 from cardgen.design.base import CardSection, RendererContext
-from cardgen.utils.dimensions import Dimensions
+from cardgen.utils.dimensions import Dimensions, inches_to_points
 from cardgen.utils.genres import build_genre_tree
-from cardgen.utils.text import Line, fit_text_block
+from cardgen.utils.text import Line, fit_text_block, string_width
+
+# Default padding for the genre panel (0.15" = 10.8 points instead of the theme's ~7.2)
+_DEFAULT_PADDING_PTS = inches_to_points(0.15)
+
+# Characters that make up the tree prefix ("│ ", "├─", "└─")
+_TREE_CHARS = "│├└─ "
+
+
+def _tree_line(genre_line: str, font_size: float, font_family: str) -> Line:
+    """
+    Build the Line for one row of the ASCII genre tree.
+
+    Separates the tree characters (drawn monospace as the prefix) from the
+    genre name (proportional font).
+
+    Args:
+        genre_line: One line of build_genre_tree() output.
+        font_size: Font size in points.
+        font_family: Font family for the genre name.
+
+    Returns:
+        Fixed-size Line for the row.
+    """
+    # Split the leading run of tree characters from the genre name
+    genre_name = genre_line.lstrip(_TREE_CHARS)
+    if not genre_name:
+        # Only tree characters (or empty): keep the last one as the text
+        genre_name = genre_line[-1:]
+    prefix = genre_line[:len(genre_line) - len(genre_name)]
+
+    return Line(
+        text=genre_name,  # Genre name (proportional font)
+        point_size=font_size,
+        leading_ratio=0.4,
+        fixed_size=True,  # Don't reduce or wrap ASCII art
+        font_family=font_family,
+        prefix=prefix  # Tree chars stay monospace, won't compress
+    )
 
 
 class GenreTreeSection(CardSection):
     """Section displaying genre hierarchy tree."""
 
+    __slots__ = ("album", "font_size", "padding_override", "_padding_pts", "_fit_cache")
+
     def __init__(
         self,
         name: str,
@@ -35,6 +74,13 @@ class GenreTreeSection(CardSection):
         self.album = album
         self.font_size = font_size
         self.padding_override = padding_override
+        # Custom padding if provided, otherwise the larger genre panel padding (points)
+        self._padding_pts = (
+            inches_to_points(padding_override) if padding_override is not None else _DEFAULT_PADDING_PTS
+        )
+        # (fit inputs, fitted lines) from the last render, stored as one
+        # tuple so readers never see a mismatched pair
+        self._fit_cache: tuple[tuple[float, float, str, str], list[Line]] | None = None
 
     def _build_text_lines(self, context: RendererContext) -> list[Line]:
         """
@@ -46,52 +92,27 @@ class GenreTreeSection(CardSection):
         Returns:
             List of Line objects representing genre tree text.
         """
-        lines: list[Line] = []
-
         # Build genre tree
         genre_tree = build_genre_tree(self.album.genres) if self.album.genres else ""
 
         # Add genre tree lines
         if not genre_tree:
-            return lines
+            return []
+
+        font_family = context.theme.font_family
+        font_size = self.font_size
+
         # Header line
-        lines.append(Line(
+        lines = [Line(
             text="Genre Tree:",
-            point_size=self.font_size,
+            point_size=font_size,
             leading_ratio=0.4,  # 40% line spacing
             fixed_size=True,  # Don't reduce header
-            font_family=f"{context.theme.font_family}-Bold"
-        ))
+            font_family=f"{font_family}-Bold"
+        )]
 
         # Genre tree lines (ASCII art - fixed size)
-        # Parse tree structure to separate tree characters from genre names
-        genre_lines = genre_tree.split("\n")
-        for genre_line in genre_lines:
-            # Match tree prefix (optional tree chars like "│ ", "├─", "└─") and genre name
-            # Pattern: optional tree characters followed by the genre name
-            match = re.match(r'^([│├└─ ]+)?(.+)$', genre_line)
-            if match:
-                prefix = match.group(1) or ""  # Tree characters (monospace)
-                genre_name = match.group(2)    # Genre name (proportional font)
-
-                lines.append(Line(
-                    text=genre_name,
-                    point_size=self.font_size,
-                    leading_ratio=0.4,
-                    fixed_size=True,  # Don't reduce or wrap ASCII art
-                    font_family=context.theme.font_family,
-                    prefix=prefix  # Tree chars stay monospace, won't compress
-                ))
-            else:
-                # Fallback: treat entire line as text
-                lines.append(Line(
-                    text=genre_line,
-                    point_size=self.font_size,
-                    leading_ratio=0.4,
-                    fixed_size=True,
-                    font_family=context.theme.font_family
-                ))
-
+        lines.extend(_tree_line(genre_line, font_size, font_family) for genre_line in genre_tree.splitlines())
         return lines
 
     def _render_fitted_lines(
@@ -113,75 +134,103 @@ class GenreTreeSection(CardSection):
         c = context.canvas
         text_y = start_y
 
+        # All lines share the text color; set it once
+        c.setFillColor(Color(*context.theme.effective_text_color))
+
+        # Emit every segment of every line through a single text object; font
+        # and horizontal scale operators are only written when they change.
+        # The scale starts unknown so the first segment always sets it.
+        text = c.beginText()
+        current_font: tuple[str, float] | None = None
+        current_scale: float | None = None
+
+        def draw_segment(x: float, y: float, segment: str, font: str, size: float, scale: float = 1.0) -> None:
+            nonlocal current_font, current_scale
+            if (font, size) != current_font:
+                text.setFont(font, size)
+                current_font = (font, size)
+            if scale != current_scale:
+                text.setHorizScale(scale * 100)
+                current_scale = scale
+            text.setTextOrigin(x, y)
+            text.textOut(segment)
+
         for fitted_line in fitted_lines:
             # Skip empty lines (spacing)
             if not fitted_line.text:
                 text_y -= fitted_line.point_size + (fitted_line.point_size * fitted_line.leading_ratio)
                 continue
 
-            c.setFillColor(Color(*context.theme.effective_text_color))
-
             # Get fonts for prefix/suffix
             prefix_font = fitted_line.prefix_font or context.theme.effective_monospace_family
             suffix_font = fitted_line.suffix_font or context.theme.effective_monospace_family
 
             # Calculate prefix width
-            prefix_width = c.stringWidth(fitted_line.prefix, prefix_font, fitted_line.point_size) if fitted_line.prefix else 0
+            prefix_width = string_width(fitted_line.prefix, prefix_font, fitted_line.point_size) if fitted_line.prefix else 0
 
             # Draw prefix (tree characters - monospace, never compressed)
             if fitted_line.prefix:
-                c.setFont(prefix_font, fitted_line.point_size)
-                c.drawString(context.x + padding, text_y, fitted_line.prefix)
+                draw_segment(context.x + padding, text_y, fitted_line.prefix, prefix_font, fitted_line.point_size)
 
             # Draw text (genre name - proportional font, can be compressed)
-            c.setFont(fitted_line.font_family, fitted_line.point_size)
-            if fitted_line.horizontal_scale < 1.0:
-                c.saveState()
-                c.translate(context.x + padding + prefix_width, text_y)
-                c.scale(fitted_line.horizontal_scale, 1.0)
-                c.drawString(0, 0, fitted_line.text)
-                c.restoreState()
-            else:
-                c.drawString(context.x + padding + prefix_width, text_y, fitted_line.text)
+            draw_segment(
+                context.x + padding + prefix_width, text_y, fitted_line.text,
+                fitted_line.font_family, fitted_line.point_size, min(fitted_line.horizontal_scale, 1.0)
+            )
 
             # Draw suffix if present (though genre tree typically doesn't have suffixes)
             if fitted_line.suffix:
-                suffix_width = c.stringWidth(fitted_line.suffix, suffix_font, fitted_line.point_size)
+                suffix_width = string_width(fitted_line.suffix, suffix_font, fitted_line.point_size)
                 available_width = context.width - (padding * 2)
                 suffix_x = context.x + padding + available_width - suffix_width
-                c.setFont(suffix_font, fitted_line.point_size)
-                c.drawString(suffix_x, text_y, fitted_line.suffix)
+                draw_segment(suffix_x, text_y, fitted_line.suffix, suffix_font, fitted_line.point_size)
 
             # Move down for next line
             text_y -= fitted_line.point_size + (fitted_line.point_size * fitted_line.leading_ratio)
 
+        # Horizontal scale is text state and outlives the text object; reset
+        # it so later drawString calls (which never write Tz) aren't compressed
+        if current_scale not in (None, 1.0):
+            text.setHorizScale(100)
+        c.drawText(text)
+
     def render(self, context: RendererContext) -> None:
         """Render genre tree using fit_text_block."""
+        # Nothing to draw (and no lines to fit) without genres
+        if not self.album.genres:
+            return
+
         c = context.canvas
 
-        # Use custom padding if provided, otherwise use larger padding for genre panel
-        if self.padding_override is not None:
-            padding = self.padding_override * 72  # Convert inches to points
-        else:
-            # Use larger padding for genre panel (0.15" = 10.8 points instead of default ~7.2 points)
-            padding = 0.15 * 72  # Convert inches to points
+        padding = self._padding_pts
 
         # Calculate available space
         available_height = context.height - (padding * 2)
         available_width = context.width - (padding * 2)
 
-        # Build Line objects
-        lines = self._build_text_lines(context)
-
-        # Fit all text within constraints
-        fitted_lines = fit_text_block(
-            c, lines, context,
-            max_width=available_width,
-            max_height=available_height,
-            min_horizontal_scale=0.7,
-            split_max=1,
-            min_point_size=5.0
+        # The genres and font size are fixed per section, so the fit only
+        # changes with the available space and the theme fonts
+        fit_key = (
+            available_width, available_height,
+            context.theme.font_family, context.theme.effective_monospace_family,
         )
+        cached = self._fit_cache
+        if cached is not None and cached[0] == fit_key:
+            fitted_lines = cached[1]
+        else:
+            # Build Line objects
+            lines = self._build_text_lines(context)
+
+            # Fit all text within constraints
+            fitted_lines = fit_text_block(
+                c, lines, context,
+                max_width=available_width,
+                max_height=available_height,
+                min_horizontal_scale=0.7,
+                split_max=1,
+                min_point_size=5.0
+            )
+            self._fit_cache = (fit_key, fitted_lines)
 
         # Render fitted lines
         start_y = context.y + context.height - padding - fitted_lines[0].point_size
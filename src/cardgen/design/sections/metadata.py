@@ -1,17 +1,31 @@
 """Metadata section implementation."""
 
 from reportlab.lib.colors import Color
+from reportlab.pdfgen.textobject import PDFTextObject
 
 from cardgen.api.models import Album
 from cardgen.design.base import CardSection, RendererContext
-from cardgen.utils.dimensions import Dimensions
+from cardgen.utils.dimensions import Dimensions, inches_to_points
 from cardgen.utils.genres import get_leaf_genres
 from cardgen.utils.text import Line, fit_text_block
 
+# Right column field prefixes, in display order
+_YEAR_PREFIX = "Year: "
+_LABEL_PREFIX = "Label: "
+_COMPOSER_PREFIX = "Composer: "
+# Continuation genres are indented to line up under the first one
+_GENRE_PREFIX = "Genre: "
+_GENRE_INDENT = "            "
+
 
 class MetadataSection(CardSection):
     """Metadata section with horizontal multi-line text in two columns."""
 
+    __slots__ = (
+        "album", "font_size", "padding_override", "_padding_pts",
+        "_left_text_lines", "_right_text_lines", "_lines_font", "_left_lines", "_right_lines",
+    )
+
     def __init__(
         self,
         name: str,
@@ -34,6 +48,35 @@ class MetadataSection(CardSection):
         self.album = album
         self.font_size = font_size
         self.padding_override = padding_override
+        # Custom padding in points, or None to use the theme's padding
+        self._padding_pts = inches_to_points(padding_override) if padding_override is not None else None
+
+        # Process album data into left and right columns once; they don't
+        # depend on the render context
+        # Left column: Leaf genres
+        leaf_genres = get_leaf_genres(album.genres)
+        self._left_text_lines: list[str] = []
+        if leaf_genres:
+            # First genre gets "Genre: " prefix
+            self._left_text_lines.append(_GENRE_PREFIX + leaf_genres[0])
+            # Subsequent genres are indented to align with first genre
+            self._left_text_lines.extend([_GENRE_INDENT + genre for genre in leaf_genres[1:]])
+
+        # Right column: Album metadata (fields without a value are skipped)
+        self._right_text_lines = [
+            prefix + str(value)
+            for prefix, value in (
+                (_YEAR_PREFIX, album.year),
+                (_LABEL_PREFIX, album.label),
+                (_COMPOSER_PREFIX, album.composer),
+            )
+            if value
+        ]
+
+        # Line lists from the last render and the theme font they were built for
+        self._lines_font: str | None = None
+        self._left_lines: list[Line] = []
+        self._right_lines: list[Line] = []
 
     def _build_text_lines_for_column(
         self, context: RendererContext, text_lines: list[str]
@@ -49,36 +92,38 @@ class MetadataSection(CardSection):
             List of Line objects.
         """
         lines: list[Line] = []
+        font_family = context.theme.font_family
+        font_size = self.font_size
         for text in text_lines:
             lines.append(Line(
                 text=text,
-                point_size=self.font_size,
+                point_size=font_size,
                 leading_ratio=0.25,  # 25% line spacing (same as tracklist)
                 fixed_size=False,  # Allow size reduction
-                font_family=context.theme.font_family
+                font_family=font_family
             ))
         return lines
 
     def _render_fitted_column(
         self,
         context: RendererContext,
+        text: PDFTextObject,
         fitted_lines: list[Line],
         x_offset: float,
         padding: float,
         rotated_width: float
     ) -> None:
         """
-        Render a single column of fitted text (in rotated coordinate system).
+        Add a single column of fitted text to the text object (in rotated coordinate system).
 
         Args:
             context: Rendering context.
+            text: Text object shared by both columns; drawn by the caller.
             fitted_lines: Fitted Line objects from fit_text_block.
             x_offset: X position for the column start.
             padding: Padding value.
             rotated_width: Width in rotated coordinate system (original height).
         """
-        c = context.canvas
-
         # Start from top of rotated space
         y_start = rotated_width - padding
         if fitted_lines:
@@ -86,69 +131,80 @@ class MetadataSection(CardSection):
 
         text_y = y_start
 
+        # Lines of a column usually share one font and scale after fitting;
+        # only write the operators when they change
+        current_font = None
+        current_scale = None
+
+        # Compressed lines use the text horizontal scale instead of a
+        # saved/scaled graphics state
         for fitted_line in fitted_lines:
-            c.setFont(fitted_line.font_family, fitted_line.point_size)
-            c.setFillColor(Color(*context.theme.effective_text_color))
+            font = (fitted_line.font_family, fitted_line.point_size)
+            if font != current_font:
+                text.setFont(*font)
+                current_font = font
 
             # Draw text with horizontal scaling if needed
-            if fitted_line.horizontal_scale < 1.0:
-                c.saveState()
-                c.translate(x_offset, text_y)
-                c.scale(fitted_line.horizontal_scale, 1.0)
-                c.drawString(0, 0, fitted_line.text)
-                c.restoreState()
-            else:
-                c.drawString(x_offset, text_y, fitted_line.text)
+            scale = min(fitted_line.horizontal_scale, 1.0)
+            if scale != current_scale:
+                text.setHorizScale(scale * 100)
+                current_scale = scale
+            text.setTextOrigin(x_offset, text_y)
+            text.textOut(fitted_line.text)
 
             # Move down for next line
             text_y -= fitted_line.point_size + (fitted_line.point_size * fitted_line.leading_ratio)
 
     def render(self, context: RendererContext) -> None:
         """Render metadata content as two columns of vertical text (rotated 90 degrees)."""
+        # Column text built in __init__
+        left_text_lines = self._left_text_lines
+        right_text_lines = self._right_text_lines
+
+        # Nothing to draw; skip the rotation state round-trip
+        if not left_text_lines and not right_text_lines:
+            return
+
         c = context.canvas
+        # Bind frequently used context values once
+        width, height = context.width, context.height
 
         # Use custom padding if provided, otherwise use theme default
-        if self.padding_override is not None:
-            padding = self.padding_override * 72  # Convert inches to points
-        else:
-            padding = context.padding
-
-        # Process album data into left and right columns
-        # Left column: Leaf genres
-        leaf_genres = get_leaf_genres(self.album.genres)
-        left_text_lines = []
-        if leaf_genres:
-            # First genre gets "Genre: " prefix
-            left_text_lines.append(f"Genre: {leaf_genres[0]}")
-            # Subsequent genres are indented to align with first genre
-            for genre in leaf_genres[1:]:
-                left_text_lines.append(f"            {genre}")
-
-        # Right column: Album metadata
-        right_text_lines = []
-        if self.album.year:
-            right_text_lines.append(f"Year: {self.album.year}")
-        if self.album.label:
-            right_text_lines.append(f"Label: {self.album.label}")
-        if self.album.composer:
-            right_text_lines.append(f"Composer: {self.album.composer}")
+        padding = self._padding_pts if self._padding_pts is not None else context.padding
 
         # After rotation, available height for text is context.width
         # Available width is context.height (split into two halves for columns)
-        available_height = context.width - (2 * padding)
-        column_width = (context.height / 2) - (2 * padding)
+        available_height = width - (2 * padding)
+        column_width = (height / 2) - (2 * padding)
+
+        # Padding leaves no room for text
+        if available_height <= 0 or column_width <= 0:
+            return
 
         # Save state and set up rotation
         c.saveState()
 
         # Translate to bottom-left of where rotated content should appear, then rotate
-        c.translate(context.x + context.width, context.y)
+        c.translate(context.x + width, context.y)
         c.rotate(90)  # 90 degrees counterclockwise
 
-        # Now we're in a rotated coordinate system
+        # Now we're in a rotated coordinate system; both columns are emitted
+        # through a single text object
+        text = c.beginText()
+        text.setFillColor(Color(*context.theme.effective_text_color))
+
+        # Line objects only depend on the column text and the theme font, so
+        # reuse them across renders; fit_text_block copies lines before
+        # adjusting them, so the cached lists are never mutated
+        font_family = context.theme.font_family
+        if font_family != self._lines_font:
+            self._left_lines = self._build_text_lines_for_column(context, left_text_lines)
+            self._right_lines = self._build_text_lines_for_column(context, right_text_lines)
+            self._lines_font = font_family
+
         # Process and render left column
         if left_text_lines:
-            left_lines = self._build_text_lines_for_column(context, left_text_lines)
+            left_lines = self._left_lines
             fitted_left = fit_text_block(
                 c, left_lines, context,
                 max_width=column_width,
@@ -157,11 +213,11 @@ class MetadataSection(CardSection):
                 split_max=1,
                 min_point_size=5.0
             )
-            self._render_fitted_column(context, fitted_left, padding, padding, context.width)
+            self._render_fitted_column(context, text, fitted_left, padding, padding, width)
 
         # Process and render right column
         if right_text_lines:
-            right_lines = self._build_text_lines_for_column(context, right_text_lines)
+            right_lines = self._right_lines
             fitted_right = fit_text_block(
                 c, right_lines, context,
                 max_width=column_width,
@@ -170,7 +226,8 @@ class MetadataSection(CardSection):
                 split_max=1,
                 min_point_size=5.0
             )
-            x_right = context.height / 2 + padding
-            self._render_fitted_column(context, fitted_right, x_right, padding, context.width)
+            x_right = height / 2 + padding
+            self._render_fitted_column(context, text, fitted_right, x_right, padding, width)
 
+        c.drawText(text)
         c.restoreState()
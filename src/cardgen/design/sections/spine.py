@@ -1,26 +1,32 @@
 """Spine section implementation."""
 
-import os
 from typing import Optional
 
-from reportlab.graphics import renderPDF
 from reportlab.lib.colors import Color
-from svglib.svglib import svg2rlg
 
 from cardgen.design.base import CardSection, RendererContext
 from cardgen.utils.album_art import AlbumArt
+from cardgen.utils.assets import draw_svg_asset, load_svg_drawing
 from cardgen.utils.dimensions import Dimensions, inches_to_points
-from cardgen.utils.text import Line, fit_text_block
+from cardgen.utils.text import Line, fit_text_block, string_width
+
+# Album art square at the top of the spine
+_ART_SIZE = 0.5  # inches
+_ART_SIZE_PTS = inches_to_points(_ART_SIZE)
+# Spine safe margin to prevent bleeding (1/16")
+_SPINE_SAFE_MARGIN_PTS = inches_to_points(0.0625)
 
 
 class SpineSection(CardSection):
     """Spine section with vertical text (artist, album, year) and optional album art."""
 
+    __slots__ = ("album_art", "text", "show_dolby_logo")
+
     def __init__(
         self,
         name: str,
         dimensions: Dimensions,
-        text_lines: list[str],
+        text: str,
         album_art: Optional[AlbumArt] = None,
         show_dolby_logo: bool = False,
     ) -> None:
@@ -30,13 +36,13 @@ class SpineSection(CardSection):
         Args:
             name: Section name.
             dimensions: Section dimensions.
-            text_lines: List of text strings for spine.
+            text: Spine text (e.g. Album.spine_text).
             album_art: Optional AlbumArt object for image processing.
             show_dolby_logo: Whether to show the Dolby NR logo on the spine.
         """
         super().__init__(name, dimensions)
         self.album_art = album_art
-        self.text_items: list[str] = text_lines
+        self.text = text
         self.show_dolby_logo = show_dolby_logo
 
     def _build_text_lines(self, context: RendererContext) -> list[Line]:
@@ -49,12 +55,9 @@ class SpineSection(CardSection):
         Returns:
             List containing a single Line object with combined spine text.
         """
-        # Combine all text items with bullet separators
-        combined_text = " • ".join(self.text_items)
-
         # Create a single line with bold font
         return [Line(
-            text=combined_text,
+            text=self.text,
             point_size=30,  # Start large to fill spine width, fit_text_block will reduce if needed
             leading_ratio=0.0,  # No line spacing for single line
             fixed_size=False,  # Allow size reduction
@@ -90,22 +93,19 @@ class SpineSection(CardSection):
         # Render the single text line (centered)
         if fitted_lines:
             fitted_line = fitted_lines[0]
-            c.setFont(fitted_line.font_family, fitted_line.point_size)
             c.setFillColor(Color(*context.theme.effective_text_color))
 
             # Calculate text width with scaling
-            base_width = c.stringWidth(fitted_line.text, fitted_line.font_family, fitted_line.point_size)
+            base_width = string_width(fitted_line.text, fitted_line.font_family, fitted_line.point_size)
             scaled_width = base_width * fitted_line.horizontal_scale
 
-            # Draw centered text with horizontal scaling if needed
-            if fitted_line.horizontal_scale < 1.0:
-                c.saveState()
-                c.translate(-scaled_width / 2, -fitted_line.point_size / 3)
-                c.scale(fitted_line.horizontal_scale, 1.0)
-                c.drawString(0, 0, fitted_line.text)
-                c.restoreState()
-            else:
-                c.drawString(-scaled_width / 2, -fitted_line.point_size / 3, fitted_line.text)
+            # Draw centered text; horizontal scaling is applied as a text
+            # state (100% when the line fits unscaled), so one path covers both
+            text = c.beginText(-scaled_width / 2, -fitted_line.point_size / 3)
+            text.setFont(fitted_line.font_family, fitted_line.point_size)
+            text.setHorizScale(fitted_line.horizontal_scale * 100)
+            text.textOut(fitted_line.text)
+            c.drawText(text)
 
         c.restoreState()
 
@@ -114,7 +114,7 @@ class SpineSection(CardSection):
         c = context.canvas
 
         # Calculate album art size if present
-        album_art_size = inches_to_points(0.5) if self.album_art else 0
+        album_art_size = _ART_SIZE_PTS if self.album_art else 0
         album_art_gap = 6 if self.album_art else 0  # Small gap between art and text
 
         # Calculate Dolby logo size if present - half the spine height
@@ -122,20 +122,18 @@ class SpineSection(CardSection):
         dolby_logo_gap = 6 if self.show_dolby_logo else 0  # Small gap between logo and text
 
         # Calculate available space for text
-        # Spine safe margin to prevent bleeding
-        spine_safe_margin_pts = inches_to_points(0.0625)  # 1/16"
-
         # After rotation: height becomes length (horizontal), width becomes height (vertical)
-        available_length = context.height - (2 * context.padding) - (2 * spine_safe_margin_pts) - album_art_size - album_art_gap - dolby_logo_height - dolby_logo_gap
+        available_length = context.height - (2 * context.padding) - (2 * _SPINE_SAFE_MARGIN_PTS) - album_art_size - album_art_gap - dolby_logo_height - dolby_logo_gap
         available_width = context.width - (2 * context.padding)
 
         # Render album art if present
         if self.album_art:
-            art_dims = Dimensions(width=0.5, height=0.5, dpi=context.dpi)
+            art_dims = Dimensions(width=_ART_SIZE, height=_ART_SIZE, dpi=context.dpi)
             point_dims = art_dims.to_points()
             pixel_dims = art_dims.to_pixels()
 
-            processed_img = self.album_art.resize_and_crop((pixel_dims.width, pixel_dims.height), mode="square")
+            # Resized and encoded once per AlbumArt and pixel size
+            img_reader = self.album_art.get_image_reader((pixel_dims.width, pixel_dims.height), mode="square")
 
             c.saveState()
             art_center_x = context.x + context.width / 2
@@ -143,29 +141,20 @@ class SpineSection(CardSection):
             c.translate(art_center_x, art_center_y)
             c.rotate(90)
 
-            img_reader = self.album_art.to_image_reader(processed_img)
-            c.drawImage(img_reader, -point_dims.width / 2, -point_dims.height / 2, width=point_dims.width, height=point_dims.height, preserveAspectRatio=True)
+            c.drawImage(img_reader, -point_dims.width / 2, -point_dims.height / 2, width=point_dims.width, height=point_dims.height)
             c.restoreState()
 
         # Render Dolby logo if requested
         if self.show_dolby_logo:
-            # Load the white Dolby logo SVG
-            assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
-            logo_path = os.path.join(assets_dir, 'dolby-b-logo-white.svg')
-
-            if os.path.exists(logo_path):
-                drawing = svg2rlg(logo_path)
+            # Load the white Dolby logo SVG (parsed once, shared across renders)
+            drawing = load_svg_drawing('dolby-b-logo-white.svg')
 
+            if drawing is not None:
                 # Calculate logo dimensions (half the spine height, maintaining aspect ratio)
                 logo_height = dolby_logo_height
                 aspect_ratio = drawing.width / drawing.height
                 logo_width = logo_height * aspect_ratio
-
-                # Scale the drawing
                 scale_factor = logo_height / drawing.height
-                drawing.width = logo_width
-                drawing.height = logo_height
-                drawing.scale(scale_factor, scale_factor)
 
                 c.saveState()
                 # Position logo to the left of text (after album art if present)
@@ -176,8 +165,11 @@ class SpineSection(CardSection):
                 c.translate(logo_center_x, logo_center_y)
                 c.rotate(90)
 
-                # Center the logo
-                renderPDF.draw(drawing, c, -logo_width / 2, -logo_height / 2)
+                # Center the logo, scaling through the canvas transform so the
+                # shared drawing is never modified
+                c.translate(-logo_width / 2, -logo_height / 2)
+                c.scale(scale_factor, scale_factor)
+                draw_svg_asset(c, drawing)
                 c.restoreState()
 
         # Draw white border around text/logo area (non-album-art section)
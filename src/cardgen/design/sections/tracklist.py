@@ -10,7 +10,7 @@ from cardgen.api.models import Track
 from cardgen.design.base import CardSection, RendererContext
 from cardgen.utils.dimensions import Dimensions
 from cardgen.utils.tape import TapeSide
-from cardgen.utils.text import fit_text_block, Line
+from cardgen.utils.text import fit_text_block, Line, string_width
 
 
 @dataclass
@@ -24,6 +24,16 @@ class MinimapSegment:
 class TracklistSection(CardSection):
     """Tracklist section with Side A/B and duration minimap."""
 
+    __slots__ = (
+        "tracks",
+        "side_capacity",
+        "title",
+        "track_title_overflow",
+        "min_track_title_char_spacing",
+        "side_a_tracks",
+        "side_b_tracks",
+    )
+
     def __init__(
         self,
         name: str,
@@ -53,6 +63,10 @@ class TracklistSection(CardSection):
         self.track_title_overflow = track_title_overflow
         self.min_track_title_char_spacing = min_track_title_char_spacing
 
+        # Split tracks by side once; render, line building and minimaps all reuse these
+        self.side_a_tracks = [t for t in tracks if t.side == "A"]
+        self.side_b_tracks = [t for t in tracks if t.side == "B"]
+
     def render(self, context: RendererContext) -> None:
         """Render track listing with Side A/B and duration minimap."""
         c = context.canvas
@@ -97,8 +111,7 @@ class TracklistSection(CardSection):
         )
 
         # Calculate Side A unused space for Side B offset
-        side_a_tracks = [t for t in self.tracks if t.side == "A"]
-        total_side_a_duration = sum(t.duration for t in side_a_tracks)
+        total_side_a_duration = sum(t.duration for t in self.side_a_tracks)
         side_a_unused_duration = self.side_capacity - total_side_a_duration
 
         text_y = self._render_fitted_lines(
@@ -118,46 +131,53 @@ class TracklistSection(CardSection):
         """
         lines: list[Line] = []
 
+        # Fonts and sizes are the same for every line; read them once
+        theme = context.theme
+        family = theme.font_family
+        bold_family = f"{family}-Bold"
+        header_size = theme.subtitle_font_size
+        track_size = theme.track_font_size
+
         # Side A header (fixed)
-        if any(t.side == "A" for t in self.tracks):
+        if self.side_a_tracks:
             lines.append(Line(
                 text="Side A",
-                point_size=context.theme.subtitle_font_size,
+                point_size=header_size,
                 leading_ratio=(1/4),  # Spacing after header
                 fixed_size=True,  # Never reduce this during iterations
-                font_family=f"{context.theme.font_family}-Bold"
+                font_family=bold_family
             ))
 
             # Side A tracks (normal text that can be reduced)
-            for track in [t for t in self.tracks if t.side == "A"]:
+            for track in self.side_a_tracks:
                 lines.append(Line(
                     text=track.title,
-                    point_size=context.theme.track_font_size,
+                    point_size=track_size,
                     leading_ratio=(1/8),  # Spacing between tracks
                     track=track,  # Reference to original track
-                    font_family=context.theme.font_family,
+                    font_family=family,
                     prefix=f"{track.track_number:2d}. ",
                     suffix=f" {track.format_duration()}"
                 ))
 
         # Side B header (fixed)
-        if any(t.side == "B" for t in self.tracks):
+        if self.side_b_tracks:
             lines.append(Line(
                 text="Side B",
-                point_size=context.theme.subtitle_font_size,
+                point_size=header_size,
                 leading_ratio=(1/4),  # Spacing after header
                 fixed_size=True,  # Never reduce this during iterations
-                font_family=f"{context.theme.font_family}-Bold"
+                font_family=bold_family
             ))
 
             # Side B tracks (normal text that can be reduced)
-            for track in [t for t in self.tracks if t.side == "B"]:
+            for track in self.side_b_tracks:
                 lines.append(Line(
                     text=track.title,
-                    point_size=context.theme.track_font_size,
+                    point_size=track_size,
                     leading_ratio=(1/8),  # Spacing between tracks
                     track=track,  # Reference to original track
-                    font_family=context.theme.font_family,
+                    font_family=family,
                     prefix=f"{track.track_number:2d}. ",
                     suffix=f" {track.format_duration()}"
                 ))
@@ -206,7 +226,7 @@ class TracklistSection(CardSection):
 
                 # Render side header with minimap
                 side_letter = fitted_line.text[-1]  # "A" or "B"
-                side_tracks = [t for t in self.tracks if t.side == side_letter]
+                side_tracks = self.side_b_tracks if side_letter == "B" else self.side_a_tracks
                 unused_offset = side_a_unused_duration if side_letter == "B" else 0
                 # when we get to B our text_y (the bottom of where we draw up from) is only offset
                 #   based on the small text point size, but we draw a subtitle point size up, which 
@@ -223,7 +243,7 @@ class TracklistSection(CardSection):
                 c.drawString(context.x + context.padding, text_y, fitted_line.text)
 
                 # Draw minimap to the right of label
-                label_width = c.stringWidth(fitted_line.text, f"{context.theme.font_family}-Bold", fitted_line.point_size)
+                label_width = string_width(fitted_line.text, f"{context.theme.font_family}-Bold", fitted_line.point_size)
                 minimap_left_margin = visible_point_size
                 minimap_start_x = context.x + context.padding + label_width + minimap_left_margin
                 minimap_available_width = text_width - label_width - minimap_left_margin
@@ -263,8 +283,8 @@ class TracklistSection(CardSection):
                 suffix_font = fitted_line.suffix_font or context.theme.effective_monospace_family
 
                 # Calculate widths
-                prefix_width = c.stringWidth(prefix, prefix_font, fitted_line.point_size) if prefix else 0
-                suffix_width = c.stringWidth(suffix, suffix_font, fitted_line.point_size) if suffix else 0
+                prefix_width = string_width(prefix, prefix_font, fitted_line.point_size) if prefix else 0
+                suffix_width = string_width(suffix, suffix_font, fitted_line.point_size) if suffix else 0
 
                 c.setFillColor(Color(*context.theme.effective_text_color))
 
@@ -273,21 +293,20 @@ class TracklistSection(CardSection):
                     c.setFont(prefix_font, fitted_line.point_size)
                     c.drawString(context.x + context.padding, text_y, prefix)
 
-                # Draw track title with horizontal scaling
-                c.setFont(context.theme.font_family, fitted_line.point_size)
+                # Draw track title with horizontal scaling. The text object's
+                # horizontal scale compresses the glyphs without saving and
+                # scaling the graphics state for every line. The scale is text
+                # state that outlives the text object, so reset it afterwards;
+                # the prefix, duration and later drawString calls never write Tz.
+                title = c.beginText(context.x + context.padding + prefix_width, text_y)
+                title.setFont(context.theme.font_family, fitted_line.point_size)
                 if fitted_line.horizontal_scale < 1.0:
-                    c.saveState()
-                    title_x = context.x + context.padding + prefix_width
-                    c.translate(title_x, text_y)
-                    c.scale(fitted_line.horizontal_scale, 1.0)
-                    c.drawString(0, 0, fitted_line.text)
-                    c.restoreState()
+                    title.setHorizScale(fitted_line.horizontal_scale * 100)
+                    title.textOut(fitted_line.text)
+                    title.setHorizScale(100)
                 else:
-                    c.drawString(
-                        context.x + context.padding + prefix_width,
-                        text_y,
-                        fitted_line.text
-                    )
+                    title.textOut(fitted_line.text)
+                c.drawText(title)
 
                 # Draw suffix (duration) - right-aligned
                 if suffix:
@@ -361,7 +380,7 @@ class TracklistSection(CardSection):
                     c.setFillColor(Color(*context.theme.background_color))
                     c.setFont(f"{context.theme.effective_monospace_family}-Bold", track_font_size)
                     track_num_str = str(segment.track_number)
-                    track_num_width = c.stringWidth(
+                    track_num_width = string_width(
                         track_num_str, f"{context.theme.effective_monospace_family}-Bold", track_font_size
                     )
 
@@ -376,7 +395,7 @@ class TracklistSection(CardSection):
                         last_digit = segment.track_number % 10
                         tens_digit = segment.track_number // 10
                         last_digit_str = str(last_digit)
-                        last_digit_width = c.stringWidth(
+                        last_digit_width = string_width(
                             last_digit_str, f"{context.theme.effective_monospace_family}-Bold", track_font_size
                         )
 
@@ -26,6 +26,9 @@ def register_fonts() -> None:
         - iosevka-bold.ttf
 
     Font files should be placed in the src/cardgen/fonts/ directory.
+
+    Safe to call once per card: fonts that are already registered are skipped,
+    so the TTF files are only parsed the first time.
     """
     fonts_to_register = [
         ("Iosevka", "iosevka-regular.ttf"),
@@ -33,6 +36,13 @@ def register_fonts() -> None:
     ]
 
     for font_name, font_file in fonts_to_register:
+        # Check if already registered
+        try:
+            pdfmetrics.getFont(font_name)
+            continue
+        except Exception:
+            pass  # Not registered yet
+
         font_path = FONTS_DIR / font_file
 
         if font_path.exists():
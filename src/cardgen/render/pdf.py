@@ -1,5 +1,7 @@
 """PDF generation using ReportLab."""
 
+from collections.abc import Sequence
+from dataclasses import replace
 from pathlib import Path
 
 from PIL import Image as PILImage
@@ -59,18 +61,22 @@ class PDFRenderer:
         # Center card on page
         offset_x, offset_y = center_on_page(card_dims.width, card_dims.height, self.page_width, self.page_height)
 
+        # Positioned card bounds in points, shared by guides, sections and palette
+        card_points = replace(card_dims, x=offset_x, y=offset_y).to_points()
+
         # Draw crop marks and fold guides if enabled
         if self.include_crop_marks:
-            self._draw_guides(c, card_dims, offset_x, offset_y, card.get_fold_lines())
+            self._draw_guides(c, card_points, card.get_fold_lines())
 
         # Draw each section
+        card_context = self._card_context(c, card.theme)
         sections = card.get_sections()
         for section in sections:
-            self._render_section(c, section, offset_x, offset_y, card.theme)
+            self._render_section(card_context, section, card_points)
 
         # Draw color palette legend if available
         if card.theme.color_palette:
-            self._draw_color_palette(c, card.theme.color_palette, card_dims, offset_x, offset_y)
+            self._draw_color_palette(c, card.theme.color_palette, card_points)
 
         # Save PDF
         c.save()
@@ -106,9 +112,12 @@ class PDFRenderer:
                 # Align to top of slot with small margin
                 offset_y = slot_y + half_page_height - card_dims.height - 0.125  # 0.125" top margin
 
+                # Positioned card bounds in points, shared by guides, sections and palette
+                card_points = replace(card_dims, x=offset_x, y=offset_y).to_points()
+
                 # Draw crop marks and fold guides if enabled
                 if self.include_crop_marks:
-                    self._draw_guides(c, card_dims, offset_x, offset_y, card.get_fold_lines())
+                    self._draw_guides(c, card_points, card.get_fold_lines())
 
                 # Draw gradient background if enabled
                 if card.theme.use_gradient and card.theme.gradient_start and card.theme.gradient_end:
@@ -125,13 +134,14 @@ class PDFRenderer:
                     )
 
                 # Draw each section
+                card_context = self._card_context(c, card.theme)
                 sections = card.get_sections()
                 for section in sections:
-                    self._render_section(c, section, offset_x, offset_y, card.theme)
+                    self._render_section(card_context, section, card_points)
 
                 # Draw color palette legend if available
                 if card.theme.color_palette:
-                    self._draw_color_palette(c, card.theme.color_palette, card_dims, offset_x, offset_y)
+                    self._draw_color_palette(c, card.theme.color_palette, card_points)
 
             # Start new page if there are more cards
             if page_idx + 2 < len(cards):
@@ -140,46 +150,53 @@ class PDFRenderer:
         # Save PDF
         c.save()
 
-    def _render_section(
-        self,
-        c: canvas.Canvas,
-        section: CardSection,  # CardSection subclass
-        offset_x: float,
-        offset_y: float,
-        theme: Theme,
-    ) -> None:
+    def _card_context(self, c: canvas.Canvas, theme: Theme) -> RendererContext:
         """
-        Render a single card section using polymorphism.
+        Build the per-card template context shared by all of a card's sections.
 
         Args:
             c: ReportLab canvas.
-            section: CardSection subclass to render.
-            offset_x: X offset for card position on page (inches).
-            offset_y: Y offset for card position on page (inches).
             theme: Theme for styling.
-        """
-        # Create positioned section dimensions
-        positioned_dims = Dimensions(
-            width=section.dimensions.width,
-            height=section.dimensions.height,
-            x=offset_x + section.dimensions.x,
-            y=offset_y + section.dimensions.y,
-            dpi=self.dpi
-        )
-        point_dims = positioned_dims.to_points()
 
-        # Create rendering context
-        context = RendererContext(
+        Returns:
+            RendererContext with canvas, theme, padding and DPI set; bounds are
+            filled in per section by _render_section().
+        """
+        return RendererContext(
             canvas=c,
-            x=point_dims.x,
-            y=point_dims.y,
-            width=point_dims.width,
-            height=point_dims.height,
+            x=0.0,
+            y=0.0,
+            width=0.0,
+            height=0.0,
             theme=theme,
             padding=inches_to_points(theme.padding),
             dpi=self.dpi,
         )
 
+    def _render_section(
+        self,
+        card_context: RendererContext,
+        section: CardSection,  # CardSection subclass
+        card_points: PointDims,
+    ) -> None:
+        """
+        Render a single card section using polymorphism.
+
+        Args:
+            card_context: Template context for the card (from _card_context()).
+            section: CardSection subclass to render.
+            card_points: Card bounds positioned on the page (points).
+        """
+        # Position the section on the page (in points)
+        dims = section.dimensions
+        context = replace(
+            card_context,
+            x=card_points.x + inches_to_points(dims.x),
+            y=card_points.y + inches_to_points(dims.y),
+            width=inches_to_points(dims.width),
+            height=inches_to_points(dims.height),
+        )
+
         # Polymorphic call - each section renders itself
         section.render(context)
 
@@ -251,22 +268,11 @@ class PDFRenderer:
         self,
         c: canvas.Canvas,
         palette: list[tuple[float, float, float]],
-        card_dims: "Dimensions",  # type: ignore # noqa: F821
-        offset_x: float,
-        offset_y: float,
+        point_dims: PointDims,
     ) -> None:
-        """Draw color palette legend outside the card area."""
+        """Draw color palette legend outside the card area (point_dims: positioned card bounds)."""
         from reportlab.lib.colors import Color, black
 
-        # Create positioned card dimensions
-        positioned_card = Dimensions(
-            width=card_dims.width,
-            height=card_dims.height,
-            x=offset_x,
-            y=offset_y
-        )
-        point_dims = positioned_card.to_points()
-
         # Position palette to the right of the card
         palette_x = point_dims.x + point_dims.width + 18  # 18pts gap from card
         palette_y_start = point_dims.y + point_dims.height - 24  # Start slightly lower
@@ -299,25 +305,14 @@ class PDFRenderer:
     def _draw_guides(
         self,
         c: canvas.Canvas,
-        card_dims: "Dimensions",  # type: ignore # noqa: F821
-        offset_x: float,
-        offset_y: float,
-        fold_lines: list[float],
+        point_dims: PointDims,
+        fold_lines: Sequence[float],
     ) -> None:
-        """Draw crop marks and fold guides."""
+        """Draw crop marks and fold guides (point_dims: positioned card bounds)."""
         c.setStrokeColor(gray)
         c.setLineWidth(0.25)
         c.setDash(1, 2)
 
-        # Create positioned card dimensions
-        positioned_card = Dimensions(
-            width=card_dims.width,
-            height=card_dims.height,
-            x=offset_x,
-            y=offset_y
-        )
-        point_dims = positioned_card.to_points()
-
         # Draw fold lines
         for fold_x in fold_lines:
             fold_x_pts = inches_to_points(fold_x) + point_dims.x
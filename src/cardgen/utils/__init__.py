@@ -17,6 +17,7 @@ from cardgen.utils.dimensions import (
     get_panel_dimensions,
     inches_to_points,
     points_to_inches,
+    points_to_pixels,
 )
 
 __all__ = [
@@ -36,4 +37,5 @@ __all__ = [
     "get_panel_dimensions",
     "inches_to_points",
     "points_to_inches",
+    "points_to_pixels",
 ]
@@ -1,6 +1,7 @@
 """Album artwork management with color extraction and image processing."""
 
 from io import BytesIO
+from threading import RLock
 from typing import Literal
 
 from PIL import Image
@@ -21,10 +22,20 @@ class AlbumArt:
         Args:
             image_bytes: Raw image data (JPEG, PNG, etc.).
         """
-        self._image = Image.open(BytesIO(image_bytes))
-        if self._image.mode != "RGB":
-            self._image = self._image.convert("RGB")
+        # Decode now: Image.open() is lazy, and threads rendering cards that
+        # share this artwork would otherwise race to load it
+        image: Image.Image = Image.open(BytesIO(image_bytes))
+        image.load()
+        self._image = image if image.mode == "RGB" else image.convert("RGB")
         self._color_palette: list[RGBColor] | None = None
+        # Guards the caches below; cards sharing this artwork may render on
+        # several threads (render_cards_to_pdfs). Reentrant because
+        # get_image_reader() fills the resize cache through resize_and_crop().
+        self._lock = RLock()
+        # Resized/cropped images keyed by (target_size, mode, align)
+        self._resized: dict[tuple[tuple[int, int], str, str], Image.Image] = {}
+        # JPEG-encoded bytes of those images, same keys
+        self._encoded: dict[tuple[tuple[int, int], str, str], bytes] = {}
 
     @property
     def image(self) -> Image.Image:
@@ -41,9 +52,10 @@ class AlbumArt:
         Returns:
             List of RGB tuples in 0-1 range.
         """
-        if self._color_palette is None:
-            self._color_palette = self._extract_dominant_colors(self._image, max_colors)
-        return self._color_palette
+        with self._lock:
+            if self._color_palette is None:
+                self._color_palette = self._extract_dominant_colors(self._image, max_colors)
+            return self._color_palette
 
     def resize_and_crop(
         self,
@@ -54,6 +66,10 @@ class AlbumArt:
         """
         Resize and crop image to target size.
 
+        Results are cached per (target_size, mode, align), so re-rendering the
+        same card (or several sections sharing this artwork) resamples once.
+        Treat the returned image as read-only.
+
         Args:
             target_size: (width, height) in pixels
             mode: "square" for aspect-preserving center crop,
@@ -61,8 +77,55 @@ class AlbumArt:
             align: Horizontal alignment for fullscale mode ("center", "left", "right")
 
         Returns:
-            Cropped PIL.Image copy (original unchanged)
+            Cropped PIL.Image (the original itself when it already has the
+            target size; the original is never modified)
+        """
+        key = (target_size, mode, align)
+        with self._lock:
+            img = self._resized.get(key)
+            if img is None:
+                img = self._resize_and_crop(target_size, mode, align)
+                self._resized[key] = img
+        return img
+
+    def get_image_reader(
+        self,
+        target_size: tuple[int, int],
+        mode: Literal["square", "fullscale"] = "square",
+        align: Literal["center", "left", "right"] = "center",
+    ) -> ImageReader:
+        """
+        Resize, crop and encode the artwork for drawing, cached per target.
+
+        Combines resize_and_crop() and photo_to_image_reader(). The encoded
+        bytes are cached, so re-drawing the same artwork skips the resample
+        and the JPEG encode. Each call returns a new ImageReader over them:
+        a reader owns a file position, so sharing one between draws (or
+        threads) would interleave their reads.
+
+        Args:
+            target_size: (width, height) in pixels
+            mode: "square" or "fullscale" (see resize_and_crop())
+            align: Horizontal alignment for fullscale mode
+
+        Returns:
+            ImageReader object ready for canvas.drawImage().
         """
+        key = (target_size, mode, align)
+        with self._lock:
+            data = self._encoded.get(key)
+            if data is None:
+                data = self._encode_jpeg(self.resize_and_crop(target_size, mode, align))
+                self._encoded[key] = data
+        return ImageReader(BytesIO(data))
+
+    def _resize_and_crop(
+        self,
+        target_size: tuple[int, int],
+        mode: Literal["square", "fullscale"],
+        align: Literal["center", "left", "right"],
+    ) -> Image.Image:
+        """Uncached implementation of resize_and_crop()."""
         target_width, target_height = target_size
 
         if mode == "square":
@@ -81,8 +144,7 @@ class AlbumArt:
                 new_width = target_width
                 new_height = int(target_width / img_ratio)
 
-            # Resize with high-quality resampling
-            img = self._image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            img = self._scaled((new_width, new_height))
 
             # Center crop to target size
             left = (new_width - target_width) // 2
@@ -90,7 +152,7 @@ class AlbumArt:
             right = left + target_width
             bottom = top + target_height
 
-            return img.crop((left, top, right, bottom)).copy()
+            return self._cropped(img, (left, top, right, bottom))
 
         elif mode == "fullscale":
             # Fullscale mode: height-based scaling with horizontal crop/alignment
@@ -99,8 +161,7 @@ class AlbumArt:
             new_height = target_height
             new_width = int(self._image.width * scale_factor)
 
-            # Resize with high-quality resampling
-            img = self._image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            img = self._scaled((new_width, new_height))
 
             # Crop horizontally based on alignment
             if new_width <= target_width:
@@ -126,28 +187,65 @@ class AlbumArt:
             top = 0
             bottom = target_height
 
-            return img.crop((left, top, right, bottom)).copy()
+            return self._cropped(img, (left, top, right, bottom))
 
         else:
             raise ValueError(f"Invalid mode: {mode}. Must be 'square' or 'fullscale'")
 
+    def _scaled(self, size: tuple[int, int]) -> Image.Image:
+        """
+        Resize the original image, skipping the resample if it is already that size.
+
+        Args:
+            size: (width, height) in pixels.
+
+        Returns:
+            Resized image, or the original image itself when no resize is needed.
+        """
+        if self._image.size == size:
+            return self._image
+        # Resize with high-quality resampling. reducing_gap lets PIL first
+        # shrink by an integer factor with a cheap box reduce, then run
+        # LANCZOS on the smaller image; at 3.0 the result is
+        # indistinguishable from a full LANCZOS pass.
+        return self._image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    def _cropped(self, img: Image.Image, box: tuple[int, int, int, int]) -> Image.Image:
+        """
+        Crop an image, skipping the crop if the box covers the whole image.
+
+        Args:
+            img: Image to crop.
+            box: (left, top, right, bottom) crop box in pixels.
+
+        Returns:
+            Cropped copy, or img itself when the box is the full image (the
+            original image is never mutated, so sharing it is safe).
+        """
+        if box == (0, 0, img.width, img.height):
+            return img
+        return img.crop(box).copy()
+
     def to_image_reader(self, processed_image: Image.Image) -> ImageReader:
         """
         Convert a processed PIL Image to ReportLab ImageReader.
 
         Args:
-            processed_image: PIL Image object to convert.
+            processed_image: PIL Image object to convert (album art, encoded as JPEG).
 
         Returns:
             ImageReader object ready for canvas.drawImage().
         """
-        return self.pil_to_image_reader(processed_image)
+        return self.photo_to_image_reader(processed_image)
 
     @staticmethod
     def pil_to_image_reader(image: Image.Image) -> ImageReader:
         """
         Convert any PIL Image to ReportLab ImageReader.
 
+        Images are encoded losslessly as PNG, so generated graphics such as
+        gradient backgrounds keep smooth color transitions.
+
         Args:
             image: PIL Image object to convert.
 
@@ -159,6 +257,42 @@ class AlbumArt:
         img_buffer.seek(0)
         return ImageReader(img_buffer)
 
+    @staticmethod
+    def photo_to_image_reader(image: Image.Image) -> ImageReader:
+        """
+        Convert a photographic PIL Image (album art) to ReportLab ImageReader.
+
+        Images are encoded as JPEG (quality 92): album art is photographic,
+        and JPEG encodes far faster and smaller than PNG's DEFLATE with no
+        visible loss in print. Images with alpha or palettes are flattened to
+        RGB first. Use pil_to_image_reader() for generated graphics and
+        transparent logos.
+
+        Args:
+            image: PIL Image object to convert.
+
+        Returns:
+            ImageReader object ready for canvas.drawImage().
+        """
+        return ImageReader(BytesIO(AlbumArt._encode_jpeg(image)))
+
+    @staticmethod
+    def _encode_jpeg(image: Image.Image) -> bytes:
+        """
+        Encode a photographic image as JPEG for photo_to_image_reader().
+
+        Args:
+            image: PIL Image object to encode.
+
+        Returns:
+            JPEG file bytes.
+        """
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        img_buffer = BytesIO()
+        image.save(img_buffer, format="JPEG", quality=92, optimize=False, progressive=False, subsampling=2)
+        return img_buffer.getvalue()
+
     def _extract_dominant_colors(
         self, image: Image.Image, max_colors: int = 8
     ) -> list[RGBColor]:
@@ -0,0 +1,62 @@
+"""Bundled asset loading (Dolby logos and other static SVGs)."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.pdfgen.canvas import Canvas
+
+# Directory holding the bundled SVG assets (cardgen/assets)
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+
+@lru_cache(maxsize=None)
+def load_svg_drawing(name: str) -> Drawing | None:
+    """
+    Parse a bundled SVG asset into a ReportLab Drawing.
+
+    Assets are static, so each file is parsed once per process. The returned
+    Drawing is shared between callers and must not be modified; scale it
+    through the canvas transform instead (canvas.scale() before
+    draw_svg_asset()).
+
+    svglib (and the XML stack behind it) is only imported on first use, so
+    cards without Dolby logos never load it.
+
+    Args:
+        name: File name inside the assets directory (e.g. "dolby-b-logo-white.svg").
+
+    Returns:
+        Parsed Drawing, or None if the asset is missing or cannot be parsed.
+    """
+    path = ASSETS_DIR / name
+    if not path.exists():
+        return None
+
+    from svglib.svglib import svg2rlg
+
+    return svg2rlg(str(path))
+
+
+def draw_svg_asset(c: Canvas, drawing: Drawing) -> None:
+    """
+    Draw a bundled SVG asset at the canvas origin, directly on the page.
+
+    The drawing is not recorded as a form XObject: ReportLab does not give
+    forms the graphics states (/ExtGState, e.g. the logos' opacity) their
+    content refers to, which leaves the PDF invalid. On the page they are
+    declared in the page resources.
+
+    renderPDF is imported on first use, like svglib in load_svg_drawing().
+
+    Args:
+        c: ReportLab canvas, already translated/scaled to the target position.
+        drawing: Drawing returned by load_svg_drawing().
+    """
+    from reportlab.graphics import renderPDF
+
+    renderPDF.draw(drawing, c, 0, 0)
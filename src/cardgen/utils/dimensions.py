@@ -1,9 +1,12 @@
 """Print specifications and dimension utilities."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass as _dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
 
-@_dataclass(frozen=True)
+@_dataclass(frozen=True, slots=True)
 class PageSize:
     """Page size specification."""
 
@@ -12,7 +15,7 @@ class PageSize:
     label: str     # display label for CLI/help
 
 
-@_dataclass(frozen=True)
+@_dataclass(frozen=True, slots=True)
 class PointDims:
     """Dimensions in points (PDF coordinate system: 72 points = 1 inch)."""
 
@@ -22,7 +25,7 @@ class PointDims:
     y: float
 
 
-@_dataclass(frozen=True)
+@_dataclass(frozen=True, slots=True)
 class PixelDims:
     """Dimensions in pixels (for image generation)."""
 
@@ -60,14 +63,21 @@ JCARD_BACK_WIDTH = 0.667  # Back panel (metadata section) - 2/3 inch
 JCARD_HEIGHT = 4.0
 JCARD_PANEL_WIDTH = 2.5  # Front and inside panels
 
+# Panel x offsets from the left edge (shared by the 4- and 5-panel layouts,
+# which are also the fold line positions)
+JCARD_SPINE_X = JCARD_BACK_WIDTH
+JCARD_FRONT_X = JCARD_SPINE_X + JCARD_SPINE_WIDTH
+JCARD_INSIDE_X = JCARD_FRONT_X + JCARD_PANEL_WIDTH
+JCARD_GENRE_X = JCARD_INSIDE_X + JCARD_PANEL_WIDTH  # 5-panel only
+
 # 4-panel j-card: Back | Spine | Front | Inside
 # Total width: 0.667" + 0.5" + 2.5" + 2.5" = 6.167"
-JCARD_4_PANEL_WIDTH = JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH + JCARD_PANEL_WIDTH
+JCARD_4_PANEL_WIDTH = JCARD_INSIDE_X + JCARD_PANEL_WIDTH
 JCARD_4_PANEL_HEIGHT = JCARD_HEIGHT
 
 # 5-panel j-card: Back | Spine | Front | Inside | Genre/Descriptors
 # Total width: 0.667" + 0.5" + 2.5" + 2.5" + 2.5" = 8.667"
-JCARD_5_PANEL_WIDTH = JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH + JCARD_PANEL_WIDTH + JCARD_PANEL_WIDTH
+JCARD_5_PANEL_WIDTH = JCARD_GENRE_X + JCARD_PANEL_WIDTH
 JCARD_5_PANEL_HEIGHT = JCARD_HEIGHT
 
 # Print specifications
@@ -84,7 +94,7 @@ DPI_RECOMMENDED = 600
 DPI_MAX = 1200
 
 
-@_dataclass
+@_dataclass(frozen=True, slots=True)
 class Dimensions:
     """
     Dimensions stored canonically in inches.
@@ -92,6 +102,9 @@ class Dimensions:
     This is the primary dimension type used throughout the codebase.
     All dimension values are in inches. Use conversion methods to
     get dimensions in other units.
+
+    Instances are immutable so they can be shared between sections and cards;
+    use dataclasses.replace() to derive a repositioned copy.
     """
 
     width: float  # inches
@@ -157,10 +170,13 @@ class Dimensions:
         )
 
 
+@lru_cache(maxsize=1)
 def get_jcard_4_panel_dimensions() -> Dimensions:
     """
     Get dimensions for standard 4-panel j-card.
 
+    The result is cached; Dimensions is immutable, so it is safe to share.
+
     Returns:
         Dimensions object for 4-panel j-card.
     """
@@ -178,11 +194,18 @@ def get_panel_dimensions() -> dict[str, Dimensions]:
     When folded, Back wraps around outside back, Front is outside front, Inside opens to the right.
 
     Returns:
-        Dictionary mapping panel names to Dimensions.
+        Dictionary mapping panel names to Dimensions (a new dict per call;
+        the Dimensions themselves are immutable and shared).
     """
+    return dict(_panel_dimensions())
+
+
+@lru_cache(maxsize=1)
+def _panel_dimensions() -> Mapping[str, Dimensions]:
+    """Build the 4-panel layout once; see get_panel_dimensions()."""
     # Layout: Back | Spine | Front | Inside
     # Back (1.0") | Spine (0.5") | Front (2.5") | Inside (2.5")
-    return {
+    return MappingProxyType({
         "back": Dimensions(
             width=JCARD_BACK_WIDTH,
             height=JCARD_HEIGHT,
@@ -192,22 +215,22 @@ def get_panel_dimensions() -> dict[str, Dimensions]:
         "spine": Dimensions(
             width=JCARD_SPINE_WIDTH,
             height=JCARD_HEIGHT,
-            x=JCARD_BACK_WIDTH,
+            x=JCARD_SPINE_X,
             y=0,
         ),
         "front": Dimensions(
             width=JCARD_PANEL_WIDTH,
             height=JCARD_HEIGHT,
-            x=JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH,
+            x=JCARD_FRONT_X,
             y=0,
         ),
         "inside": Dimensions(
             width=JCARD_PANEL_WIDTH,
             height=JCARD_HEIGHT,
-            x=JCARD_BACK_WIDTH + JCARD_SPINE_WIDTH + JCARD_PANEL_WIDTH,
+            x=JCARD_INSIDE_X,
             y=0,
         ),
-    }
+    })
 
 
 def center_on_page(content_width: float, content_height: float, page_width: float = PAGE_WIDTH, page_height: float = PAGE_HEIGHT) -> tuple[float, float]:
@@ -252,3 +275,20 @@ def points_to_inches(points: float) -> float:
         Measurement in inches.
     """
     return points / 72
+
+
+def points_to_pixels(points: float, dpi: int) -> int:
+    """
+    Convert points to whole pixels at the given DPI.
+
+    Truncates exactly like Dimensions.to_pixels(), without building a
+    Dimensions object.
+
+    Args:
+        points: Measurement in points.
+        dpi: Dots per inch.
+
+    Returns:
+        Measurement in pixels.
+    """
+    return int(points / 72 * dpi)
@@ -1,14 +1,19 @@
 """Genre hierarchy utilities for building ASCII trees from genre relationships."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=1)
 def load_genre_hierarchy() -> dict[str, Any]:
     """
     Load genre hierarchy from JSON file.
 
+    The file is parsed once per process and the dictionary is shared between
+    callers, so treat it as read-only.
+
     Returns:
         Dictionary mapping genre names to their metadata (parents, depth, etc).
     """
@@ -38,27 +43,7 @@ def build_genre_tree(genres: list[str]) -> str:
     if not genres:
         return ""
 
-    hierarchy = load_genre_hierarchy()
-
-    # Build ALL paths for each genre (including all parent chains)
-    all_paths: list[list[str]] = []
-
-    for genre in genres:
-        if genre not in hierarchy:
-            # Genre not in hierarchy, add it as standalone
-            all_paths.append([genre])
-            continue
-
-        # Get all parent paths for this genre
-        genre_data = hierarchy[genre]
-        paths = _get_all_parent_paths(genre, genre_data, hierarchy)
-        all_paths.extend(paths)
-
-    # Build tree structure
-    tree = _build_tree_structure(all_paths)
-
-    # Render as ASCII
-    return _render_tree(tree)
+    return _render_genre_tree(tuple(genres))
 
 
 def get_leaf_genres(genres: list[str]) -> list[str]:
@@ -78,6 +63,25 @@ def get_leaf_genres(genres: list[str]) -> list[str]:
     if not genres:
         return []
 
+    # Extract leaf nodes (genres with no children)
+    return _extract_leaves(_genre_tree(tuple(genres)))
+
+
+@lru_cache(maxsize=256)
+def _genre_tree(genres: tuple[str, ...]) -> dict[str, Any]:
+    """
+    Build the nested genre tree for a set of genres, once per genre tuple.
+
+    Shared by build_genre_tree() and get_leaf_genres(), which the genre tree
+    and metadata sections call for the same album on every render. The
+    returned tree is cached, so treat it as read-only.
+
+    Args:
+        genres: Genre names (as a tuple, so it can be a cache key).
+
+    Returns:
+        Nested dictionary representing the tree.
+    """
     hierarchy = load_genre_hierarchy()
 
     # Build ALL paths for each genre (including all parent chains)
@@ -95,10 +99,21 @@ def get_leaf_genres(genres: list[str]) -> list[str]:
         all_paths.extend(paths)
 
     # Build tree structure
-    tree = _build_tree_structure(all_paths)
+    return _build_tree_structure(all_paths)
 
-    # Extract leaf nodes (genres with no children)
-    return _extract_leaves(tree)
+
+@lru_cache(maxsize=256)
+def _render_genre_tree(genres: tuple[str, ...]) -> str:
+    """
+    Render the ASCII genre tree for a set of genres, once per genre tuple.
+
+    Args:
+        genres: Genre names (as a tuple, so it can be a cache key).
+
+    Returns:
+        ASCII art string showing genre relationships.
+    """
+    return _render_tree(_genre_tree(genres))
 
 
 def _get_all_parent_paths(genre: str, genre_data: dict[str, Any], hierarchy: dict[str, Any]) -> list[list[str]]:
@@ -198,6 +213,9 @@ def _render_tree(tree: dict[str, Any], prefix: str = "", is_last: bool = True) -
     """
     Render tree structure as ASCII art.
 
+    Walks the tree depth-first with an explicit stack instead of recursing
+    per level, emitting lines in the same pre-order as a recursive walk.
+
     Args:
         tree: Nested dictionary representing the tree.
         prefix: Current line prefix for indentation.
@@ -207,25 +225,44 @@ def _render_tree(tree: dict[str, Any], prefix: str = "", is_last: bool = True) -
         ASCII art string.
     """
     lines: list[str] = []
-    items = list(tree.items())
 
-    for idx, (genre, children) in enumerate(items):
-        is_last_item = (idx == len(items) - 1)
+    # Stack of (genre, children, prefix, is_last_item); siblings are pushed in
+    # reverse so they pop in their original order
+    stack: list[tuple[str, dict[str, Any], str, bool]] = []
+    _push_children(stack, tree, prefix)
+
+    while stack:
+        genre, children, item_prefix, is_last_item = stack.pop()
 
         # Add the genre to lines
-        if prefix == "":
+        if item_prefix == "":
             # Root level - no connector
             lines.append(genre)
         else:
             # Child level - use tree connectors
             connector = "└─" if is_last_item else "├─"
-            lines.append(f"{prefix}{connector}{genre}")
+            lines.append(f"{item_prefix}{connector}{genre}")
 
-        # Recursively render children
+        # Queue children to be rendered next (directly below this genre)
         if children:
-            new_prefix = prefix + ("  " if is_last_item else "│ ")
-            child_output = _render_tree(children, new_prefix, is_last_item)
-            if child_output:
-                lines.append(child_output)
+            _push_children(stack, children, item_prefix + ("  " if is_last_item else "│ "))
 
     return "\n".join(lines)
+
+
+def _push_children(
+    stack: list[tuple[str, dict[str, Any], str, bool]], tree: dict[str, Any], prefix: str
+) -> None:
+    """
+    Push a tree level onto the render stack in reverse order.
+
+    Args:
+        stack: Render stack used by _render_tree.
+        tree: Tree level to push.
+        prefix: Line prefix shared by this level.
+    """
+    items = list(tree.items())
+    last_idx = len(items) - 1
+    for idx in range(last_idx, -1, -1):
+        genre, children = items[idx]
+        stack.append((genre, children, prefix, idx == last_idx))
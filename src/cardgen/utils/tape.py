@@ -1,6 +1,8 @@
 """Cassette tape utilities for side calculation."""
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 
 from cardgen.api.models import Track
 
@@ -20,6 +22,23 @@ class TapeSide:
         return self.max_duration - self.total_duration
 
 
+def _find_side_split(durations: list[int], capacity: int) -> int:
+    """
+    Find how many leading tracks fit within a side's capacity.
+
+    Running totals of non-negative durations are sorted, so the split is a
+    binary search over the prefix sums rather than a per-track Python loop.
+
+    Args:
+        durations: Track durations in seconds, in album order.
+        capacity: Side capacity in seconds.
+
+    Returns:
+        Number of leading tracks whose cumulative duration fits on the side.
+    """
+    return bisect_right(list(accumulate(durations)), capacity)
+
+
 def assign_tape_sides(tracks: list[Track], tape_length_minutes: int = 90) -> int:
     """
     Assign side="A" or side="B" to each track based on tape capacity.
@@ -43,7 +62,8 @@ def assign_tape_sides(tracks: list[Track], tape_length_minutes: int = 90) -> int
     side_capacity_seconds = (tape_length_minutes * 60) // 2
 
     # Check if album fits on tape
-    total_duration = sum(track.duration for track in tracks)
+    durations = [track.duration for track in tracks]
+    total_duration = sum(durations)
     tape_capacity = tape_length_minutes * 60
     if total_duration > tape_capacity:
         raise ValueError(
@@ -59,24 +79,14 @@ def assign_tape_sides(tracks: list[Track], tape_length_minutes: int = 90) -> int
                 f"exceeds single side capacity ({side_capacity_seconds // 60} minutes)"
             )
 
-    # Assign Side A to as many tracks as possible
-    side_a_duration = 0
-    split_index = 0
+    # Find how many leading tracks fit on Side A
+    split_index = _find_side_split(durations, side_capacity_seconds)
+    side_a_duration = sum(durations[:split_index])
 
+    # Assign sides in a single pass; Side B gets everything after the split
     for i, track in enumerate(tracks):
-        if side_a_duration + track.duration <= side_capacity_seconds:
-            track.side = "A"
-            side_a_duration += track.duration
-            split_index = i + 1
-        else:
-            # Can't fit this track on Side A, stop here
-            break
-
-    # Assign Side B to remaining tracks
-    side_b_duration = 0
-    for i in range(split_index, len(tracks)):
-        tracks[i].side = "B"
-        side_b_duration += tracks[i].duration
+        track.side = "A" if i < split_index else "B"
+    side_b_duration = total_duration - side_a_duration
 
     # Validate Side B doesn't exceed capacity
     if side_b_duration > side_capacity_seconds:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, List
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen.canvas import Canvas
 
 if TYPE_CHECKING:
@@ -11,11 +13,31 @@ if TYPE_CHECKING:
     from cardgen.design.base import RendererContext
 
 
+@lru_cache(maxsize=10_000)
+def string_width(text: str, font_family: str, point_size: float) -> float:
+    """
+    Measure text width in points, memoized across renders.
+
+    Font metrics don't depend on the canvas, so this goes straight to
+    pdfmetrics and caches by (text, font, size); batches repeatedly measure
+    the same titles, labels and prefixes.
+
+    Args:
+        text: Text to measure.
+        font_family: Registered font name.
+        point_size: Font size in points.
+
+    Returns:
+        Width in points.
+    """
+    return pdfmetrics.stringWidth(text, font_family, point_size)
+
+
 # ============================================================================
 # Advanced Text Block Fitting with Arbitrary Line Sizes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     """
     Represents a line of text with typographical properties.
@@ -46,14 +68,11 @@ class Line:
     suffix_font: str | None = None
 
 
-def _measure_line_width(
-    canvas: Canvas, text: str, font_family: str, point_size: float, horizontal_scale: float
-) -> float:
+def _measure_line_width(text: str, font_family: str, point_size: float, horizontal_scale: float) -> float:
     """
     Measure the width of text with horizontal scaling applied.
 
     Args:
-        canvas: ReportLab canvas for measuring text.
         text: Text to measure.
         font_family: Font family name.
         point_size: Font size in points.
@@ -62,21 +81,43 @@ def _measure_line_width(
     Returns:
         Width in points.
     """
-    base_width = canvas.stringWidth(text, font_family, point_size)
+    base_width = string_width(text, font_family, point_size)
     return base_width * horizontal_scale
 
 
+@lru_cache(maxsize=1024)
+def _split_words(text: str) -> tuple[str, ...]:
+    """
+    Tokenize text into words once per distinct string.
+
+    Long texts (descriptors, track titles) are re-split at every candidate
+    size while fitting, so the tokenization is shared across size probes.
+
+    Args:
+        text: Text to split on whitespace.
+
+    Returns:
+        Tuple of words.
+    """
+    return tuple(text.split())
+
+
+@lru_cache(maxsize=2048)
 def _split_line_at_word_boundary(
-    canvas: Canvas, text: str, max_width: float, font_family: str, point_size: float,
+    text: str, max_width: float, font_family: str, point_size: float,
     horizontal_scale: float, split_max: int
-) -> List[str]:
+) -> tuple[str, ...]:
     """
     Split text at word boundaries to fit within max_width, up to split_max times.
 
-    Uses greedy algorithm to fill each line as much as possible.
+    Uses greedy algorithm to fill each line as much as possible. Each word is
+    measured once and line widths are kept as running totals (word widths plus
+    spaces), rather than re-measuring the whole candidate line per word.
+
+    Results are memoized: fit_text_block re-splits the same text at the same
+    sizes across iterations and re-renders, so repeats are a dict lookup.
 
     Args:
-        canvas: ReportLab canvas for measuring text.
         text: Text to split.
         max_width: Maximum width per line.
         font_family: Font family name.
@@ -85,50 +126,52 @@ def _split_line_at_word_boundary(
         split_max: Maximum number of splits (e.g., 1 = max 2 lines).
 
     Returns:
-        List of text segments (up to split_max + 1 lines).
+        Tuple of text segments (up to split_max + 1 lines).
     """
-    words = text.split()
+    words = _split_words(text)
     lines = []
     current_line = ""
+    current_width = 0.0
+    space_width = string_width(" ", font_family, point_size) * horizontal_scale
 
-    for word in words:
-        test_line = f"{current_line} {word}".strip() if current_line else word
-        width = _measure_line_width(canvas, test_line, font_family, point_size, horizontal_scale)
+    for i, word in enumerate(words):
+        word_width = string_width(word, font_family, point_size) * horizontal_scale
+        width = current_width + space_width + word_width if current_line else word_width
 
         if width <= max_width:
-            current_line = test_line
+            current_line = f"{current_line} {word}" if current_line else word
+            current_width = width
         else:
             # Current line is full, start new line
             if current_line:
                 lines.append(current_line)
                 current_line = word
+                current_width = word_width
             else:
                 # Single word doesn't fit, force it on its own line
                 lines.append(word)
                 current_line = ""
+                current_width = 0.0
 
             # Check if we've reached split limit
             if len(lines) > split_max:
                 # Combine remaining into last line
-                remaining_words = words[words.index(word):]
-                current_line = " ".join(remaining_words)
+                current_line = " ".join(words[i:])
                 break
 
     if current_line:
         lines.append(current_line)
 
-    return lines
+    return tuple(lines)
 
 
 def _truncate_at_word_boundary(
-    canvas: Canvas, text: str, max_width: float, font_family: str, point_size: float,
-    horizontal_scale: float
+    text: str, max_width: float, font_family: str, point_size: float, horizontal_scale: float
 ) -> str:
     """
     Truncate text at word boundary with ellipsis to fit within max_width.
 
     Args:
-        canvas: ReportLab canvas for measuring text.
         text: Text to truncate.
         max_width: Maximum width.
         font_family: Font family name.
@@ -139,26 +182,30 @@ def _truncate_at_word_boundary(
         Truncated text with ellipsis (e.g., "Some text…").
     """
     ellipsis = "…"
-    ellipsis_width = _measure_line_width(canvas, ellipsis, font_family, point_size, horizontal_scale)
+    ellipsis_width = _measure_line_width(ellipsis, font_family, point_size, horizontal_scale)
     available_width = max_width - ellipsis_width
 
-    words = text.split()
-    truncated = ""
+    # Keep as many leading words as fit, tracking the running width
+    # (word widths plus spaces) instead of re-measuring each prefix
+    words = _split_words(text)
+    space_width = string_width(" ", font_family, point_size) * horizontal_scale
+    width = 0.0
+    word_count = 0
 
     for i, word in enumerate(words):
-        test_line = " ".join(words[:i+1])
-        width = _measure_line_width(canvas, test_line, font_family, point_size, horizontal_scale)
+        word_width = string_width(word, font_family, point_size) * horizontal_scale
+        width = width + space_width + word_width if i else word_width
 
-        if width <= available_width:
-            truncated = test_line
-        else:
+        if width > available_width:
             break
+        word_count = i + 1
 
+    truncated = " ".join(words[:word_count])
     return truncated + ellipsis if truncated else ellipsis
 
 
 def _process_lines_at_current_size(
-    canvas: Canvas, lines: List[Line], context: RendererContext, max_width: float,
+    lines: List[Line], context: RendererContext, max_width: float,
     min_horizontal_scale: float, split_max: int
 ) -> List[Line]:
     """
@@ -171,7 +218,6 @@ def _process_lines_at_current_size(
     4. Accounts for prefix/suffix width when calculating effective width for text
 
     Args:
-        canvas: ReportLab canvas for measuring text.
         lines: Input lines with point_size, leading_ratio, and font_family set.
         context: Rendering context with font configuration.
         max_width: Maximum width constraint (total available width).
@@ -189,11 +235,11 @@ def _process_lines_at_current_size(
         prefix_font = line.prefix_font or context.theme.effective_monospace_family
         suffix_font = line.suffix_font or context.theme.effective_monospace_family
 
-        prefix_width = canvas.stringWidth(line.prefix, prefix_font, line.point_size) if line.prefix else 0
-        suffix_width = canvas.stringWidth(line.suffix, suffix_font, line.point_size) if line.suffix else 0
+        prefix_width = string_width(line.prefix, prefix_font, line.point_size) if line.prefix else 0
+        suffix_width = string_width(line.suffix, suffix_font, line.point_size) if line.suffix else 0
         effective_width = max_width - prefix_width - suffix_width
 
-        base_width = canvas.stringWidth(line.text, line.font_family, line.point_size)
+        base_width = string_width(line.text, line.font_family, line.point_size)
 
         if base_width <= effective_width:
             # Line fits without compression
@@ -232,20 +278,20 @@ def _process_lines_at_current_size(
             else:
                 # Compression too extreme - try splitting
                 split_lines = _split_line_at_word_boundary(
-                    canvas, line.text, effective_width, line.font_family, line.point_size,
+                    line.text, effective_width, line.font_family, line.point_size,
                     min_horizontal_scale, split_max
                 )
 
                 # Calculate scale needed for each split line
                 split_parts = []
                 for i, split_text in enumerate(split_lines):
-                    split_width = canvas.stringWidth(split_text, line.font_family, line.point_size)
+                    split_width = string_width(split_text, line.font_family, line.point_size)
                     split_scale = effective_width / split_width if split_width > effective_width else 1.0
 
                     # If last line and scale still too extreme, truncate
                     if i == len(split_lines) - 1 and split_scale < min_horizontal_scale:
                         split_text = _truncate_at_word_boundary(
-                            canvas, split_text, effective_width, line.font_family, line.point_size,
+                            split_text, effective_width, line.font_family, line.point_size,
                             min_horizontal_scale
                         )
                         split_scale = min_horizontal_scale
@@ -310,7 +356,8 @@ def fit_text_block(
     3. If total height exceeds max_height, reduces all point sizes proportionally and retries
 
     Args:
-        canvas: ReportLab canvas for measuring text.
+        canvas: ReportLab canvas the text is drawn on. Widths come from the
+            font metrics (string_width), so it is not used for measuring.
         lines: List of Line objects with text, point_size, leading_ratio, and font_family.
         context: Rendering context with font configuration.
         max_width: Maximum width constraint (post-margin).
@@ -323,36 +370,42 @@ def fit_text_block(
     Returns:
         List of fitted Line objects with final text, point_size, leading_ratio, font_family, and horizontal_scale.
     """
-    # Make copies of input lines to avoid mutating originals
-    current_lines = [copy.copy(line) for line in lines]
-
-    while True:
-        # Process lines at current sizes
-        processed_lines = _process_lines_at_current_size(
-            canvas, current_lines, context, max_width,
-            min_horizontal_scale, split_max
-        )
+    # Measure the input lines directly: _process_lines_at_current_size builds
+    # new Line objects, so originals are only copied (below) once sizes need
+    # reducing. Text that fits at its initial sizes takes one pass, no copies.
+    current_lines = lines
+    copied = False
 
-        # Calculate total height
-        total_height = _calculate_total_height(processed_lines)
+    # If all lines are fixed_size, sizes can never be reduced
+    has_reducible = any(not line.fixed_size for line in lines)
 
-        # Check if we fit within vertical constraints
-        if total_height <= max_height:
-            return processed_lines
-
-        # Check if we've hit minimum size
-        min_size = min(line.point_size for line in current_lines)
-        if min_size <= min_point_size:
-            # Can't reduce further, return best effort
-            return processed_lines
+    while True:
+        # Check if we've hit minimum size (or can't reduce at all); this pass
+        # is then the last one and its result is returned as best effort
+        min_size = min((line.point_size for line in current_lines), default=0.0)
+        last_pass = min_size <= min_point_size or not has_reducible
+
+        # Processing keeps each line's size and leading and only ever adds
+        # lines (splits), so the block can't fit while the unprocessed lines
+        # are already too tall. Skip measuring those sizes and go straight to
+        # the next reduction.
+        if last_pass or _calculate_total_height(current_lines) <= max_height:
+            # Process lines at current sizes
+            processed_lines = _process_lines_at_current_size(
+                current_lines, context, max_width,
+                min_horizontal_scale, split_max
+            )
+
+            # Check if we fit within vertical constraints
+            if last_pass or _calculate_total_height(processed_lines) <= max_height:
+                return processed_lines
+
+        # Make copies of input lines to avoid mutating originals
+        if not copied:
+            current_lines = [copy.copy(line) for line in current_lines]
+            copied = True
 
         # Reduce font sizes proportionally (skip fixed_size lines)
-        size_changed = False
         for line in current_lines:
             if not line.fixed_size:
                 line.point_size *= size_reduction_ratio
-                size_changed = True
-
-        # If all lines are fixed_size, we can't reduce further
-        if not size_changed:
-            return processed_lines
@@ -0,0 +1,43 @@
+"""Album art resizing and encoding caches."""
+
+from io import BytesIO
+
+from PIL import Image
+
+from cardgen.utils.album_art import AlbumArt
+
+
+def _album_art(size: tuple[int, int] = (64, 48)) -> AlbumArt:
+    buffer = BytesIO()
+    Image.new("RGB", size, (40, 90, 160)).save(buffer, format="JPEG")
+    return AlbumArt(buffer.getvalue())
+
+
+def test_get_image_reader_encodes_once(monkeypatch):
+    art = _album_art()
+    calls = []
+    original = AlbumArt._encode_jpeg
+
+    def counting_encode(image: Image.Image) -> bytes:
+        calls.append(image.size)
+        return original(image)
+
+    monkeypatch.setattr(AlbumArt, "_encode_jpeg", staticmethod(counting_encode))
+
+    art.get_image_reader((32, 32))
+    art.get_image_reader((32, 32))
+    art.get_image_reader((16, 16))
+
+    assert calls == [(32, 32), (16, 16)]
+
+
+def test_get_image_reader_returns_independent_readers():
+    art = _album_art()
+    first = art.get_image_reader((32, 32))
+    second = art.get_image_reader((32, 32))
+
+    assert first is not second
+    # A partial read on one reader must not move the other's file position
+    first.fp.read(10)
+    assert second.getSize() == (32, 32)
+    assert second.getRGBData() == first.getRGBData()
@@ -0,0 +1,87 @@
+"""Batch rendering through the high-level API."""
+
+from io import BytesIO
+
+from PIL import Image
+
+from cardgen.api.builder import create_card_from_album, render_cards_to_pdfs
+from cardgen.api.models import Album, Track
+from cardgen.config import Theme
+from cardgen.design.cards import JCard4Panel, JCard5Panel
+from cardgen.utils.album_art import AlbumArt
+
+
+def _cover_art() -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (64, 64), (40, 90, 160)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _album(artist: str, title: str, cover_art: bytes) -> Album:
+    return Album(
+        id=f"{artist}-{title}",
+        title=title,
+        artist=artist,
+        year=2001,
+        genres=["Shoegaze"],
+        label="Label",
+        cover_art=cover_art,
+        tracks=[Track(title=f"Song {i}", duration=240, track_number=i) for i in range(1, 9)],
+    )
+
+
+def _card(artist: str, title: str) -> JCard5Panel:
+    cover_art = _cover_art()
+    return create_card_from_album(_album(artist, title, cover_art), AlbumArt(cover_art), JCard5Panel)
+
+
+def _assert_valid_pdf(path):
+    data = path.read_bytes()
+    assert data.startswith(b"%PDF-")
+    assert data.rstrip().endswith(b"%%EOF")
+
+
+def test_render_cards_to_pdfs_writes_one_pdf_per_card(tmp_path):
+    cards = [_card("Artist One", "First Album"), _card("Artist Two", "Second Album")]
+
+    paths = render_cards_to_pdfs(cards, tmp_path / "out", dpi=72)
+
+    assert [path.name for path in paths] == ["Artist One - First Album.pdf", "Artist Two - Second Album.pdf"]
+    for path in paths:
+        _assert_valid_pdf(path)
+
+
+def test_render_cards_to_pdfs_deduplicates_colliding_names(tmp_path):
+    cards = [_card("Artist", "Album"), _card("Artist", "Album"), _card("ARTIST", "ALBUM")]
+
+    paths = render_cards_to_pdfs(cards, tmp_path, dpi=72)
+
+    assert [path.name for path in paths] == ["Artist - Album.pdf", "Artist - Album (2).pdf", "ARTIST - ALBUM (3).pdf"]
+    assert len(set(paths)) == 3
+    for path in paths:
+        _assert_valid_pdf(path)
+
+
+def test_render_cards_to_pdfs_with_shared_album_art(tmp_path):
+    # Noisy artwork so decoding and encoding take long enough for threads to overlap
+    buffer = BytesIO()
+    Image.effect_noise((800, 800), 64).convert("RGB").save(buffer, format="JPEG")
+    cover_art = buffer.getvalue()
+    logo_path = tmp_path / "logo.png"
+    Image.new("RGBA", (40, 20), (255, 0, 0, 128)).save(logo_path)
+
+    # One AlbumArt shared by every card, as when one album is rendered in several layouts
+    album_art = AlbumArt(cover_art)
+    theme = Theme(label_logo=str(logo_path))
+    cards = [
+        create_card_from_album(
+            _album("Artist", f"Album {i}", cover_art), album_art, (JCard4Panel, JCard5Panel)[i % 2], theme
+        )
+        for i in range(16)
+    ]
+
+    paths = render_cards_to_pdfs(cards, tmp_path / "out", dpi=150, max_workers=16)
+
+    assert len(paths) == 16
+    for path in paths:
+        _assert_valid_pdf(path)
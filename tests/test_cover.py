@@ -0,0 +1,88 @@
+"""Label logo loading for the cover section."""
+
+import threading
+import wave
+
+import pytest
+from PIL import Image
+
+from cardgen.config import Theme
+from cardgen.design.base import RendererContext
+from cardgen.design.sections import cover
+from cardgen.utils.dimensions import Dimensions
+
+
+def test_session_is_reused_within_a_thread():
+    assert cover._session() is cover._session()
+
+
+def test_session_is_not_shared_between_threads():
+    sessions = {}
+
+    def worker(name: str) -> None:
+        sessions[name] = cover._session()
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in (cover._session(), sessions["a"], sessions["b"])}) == 3
+
+
+@pytest.mark.parametrize("fmt, suffix", [("PNG", "png"), ("ICO", "ico"), ("TGA", "tga"), ("PPM", "ppm"), ("WEBP", "webp")])
+def test_load_label_logo_accepts_formats_pil_reads(tmp_path, fmt, suffix):
+    path = tmp_path / f"logo.{suffix}"
+    Image.new("RGB", (32, 32), (200, 30, 30)).save(path, format=fmt)
+
+    reader, aspect_ratio = cover._load_label_logo(str(path))
+
+    assert reader.getSize() == (32, 32)
+    assert aspect_ratio == 1.0
+
+
+def _wav(path) -> None:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(b"\x00\x00" * 100)
+
+
+@pytest.mark.parametrize("write", [_wav, lambda path: path.write_text("<html>Not Found</html>")])
+def test_load_label_logo_rejects_non_images(tmp_path, write):
+    path = tmp_path / "logo"
+    write(path)
+
+    with pytest.raises(cover._LOGO_ERRORS):
+        cover._load_label_logo(str(path))
+
+
+def test_load_label_logo_rejects_corrupt_image(tmp_path):
+    path = tmp_path / "logo.png"
+    Image.new("RGB", (32, 16)).save(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:40] + b"\x00" * 16 + data[56:])
+
+    with pytest.raises(cover._LOGO_ERRORS):
+        cover._load_label_logo(str(path))
+
+
+def _context(theme: Theme) -> RendererContext:
+    return RendererContext(canvas=None, x=0, y=0, width=144, height=288, theme=theme, padding=7.2, dpi=72)
+
+
+def test_text_lines_are_cached_per_theme_fonts():
+    section = cover.CoverSection("front", Dimensions(width=2.0, height=4.0), None, title="Title", artist="Artist")
+    theme = Theme()
+
+    lines = section._build_text_lines(_context(theme))
+    assert section._build_text_lines(_context(theme)) is lines
+
+    larger = theme.model_copy(update={"title_font_size": theme.title_font_size + 4})
+    rebuilt = section._build_text_lines(_context(larger))
+    assert rebuilt is not lines
+    assert rebuilt[0].point_size == theme.title_font_size + 4
+    # The cache holds the key and lines together
+    assert section._lines_cache is not None and section._lines_cache[1] is rebuilt
@@ -0,0 +1,14 @@
+"""Print dimension helpers."""
+
+from cardgen.utils.dimensions import JCARD_SPINE_X, get_panel_dimensions
+
+
+def test_get_panel_dimensions_returns_a_fresh_dict():
+    panels = get_panel_dimensions()
+    assert type(panels) is dict
+    assert list(panels) == ["back", "spine", "front", "inside"]
+    assert panels["spine"].x == JCARD_SPINE_X
+
+    # Callers may edit their copy without affecting later calls
+    panels["extra"] = panels.pop("back")
+    assert list(get_panel_dimensions()) == ["back", "spine", "front", "inside"]
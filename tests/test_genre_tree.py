@@ -0,0 +1,40 @@
+"""Genre tree section fitting cache."""
+
+from reportlab.pdfgen.canvas import Canvas
+
+from cardgen.api.models import Album
+from cardgen.config import Theme
+from cardgen.design.base import RendererContext
+from cardgen.design.sections import genre_tree
+from cardgen.utils.dimensions import Dimensions
+
+
+def _context(c: Canvas, width: float) -> RendererContext:
+    return RendererContext(canvas=c, x=0, y=0, width=width, height=216, theme=Theme(), padding=7.2, dpi=72)
+
+
+def test_fit_is_reused_until_the_space_changes(tmp_path, monkeypatch):
+    album = Album(
+        id="test", title="Title", artist="Artist", year=None, genres=["Rock", "Shoegaze"],
+        label=None, cover_art=b"", tracks=[],
+    )
+    section = genre_tree.GenreTreeSection("genres", Dimensions(width=3.0, height=3.0), album, font_size=10.0)
+    c = Canvas(str(tmp_path / "out.pdf"))
+
+    calls = []
+    original = genre_tree.fit_text_block
+
+    def counting_fit(*args, **kwargs):
+        calls.append(kwargs["max_width"])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(genre_tree, "fit_text_block", counting_fit)
+
+    section.render(_context(c, 216))
+    section.render(_context(c, 216))
+    assert len(calls) == 1
+
+    section.render(_context(c, 144))
+    assert len(calls) == 2
+    # The cache holds the key and fitted lines together
+    assert section._fit_cache is not None and section._fit_cache[0][0] == calls[-1]
@@ -0,0 +1,34 @@
+"""Package imports stay lightweight until the heavy parts are used."""
+
+import os
+import subprocess
+import sys
+
+_HEAVY = ("PIL", "requests", "libopensonic", "svglib", "cardgen.design.sections", "cardgen.render")
+
+
+def _loaded_after(statement: str) -> set[str]:
+    """Run an import in a fresh interpreter and return the heavy modules it loaded."""
+    script = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env)
+    return {m for m in result.stdout.split() if m.startswith(_HEAVY)}
+
+
+def test_import_package_is_lazy():
+    assert _loaded_after("import cardgen") == set()
+
+
+def test_import_card_class_skips_sections():
+    assert _loaded_after("from cardgen import JCard5Panel") == set()
+    assert _loaded_after("from cardgen.design.cards import JCard4Panel") == set()
+
+
+def test_lazy_names_resolve():
+    import cardgen
+    import cardgen.api
+
+    for name in cardgen.__all__:
+        assert getattr(cardgen, name) is not None
+    for name in cardgen.api.__all__:
+        assert getattr(cardgen.api, name) is not None
@@ -0,0 +1,25 @@
+"""Album model helpers."""
+
+from cardgen.api.models import Album
+
+
+def _album(year: int | None) -> Album:
+    return Album(
+        id="test", title="Title", artist="Artist", year=year, genres=[], label=None, cover_art=b"", tracks=[]
+    )
+
+
+def test_spine_text_joins_artist_title_and_year():
+    assert _album(1999).spine_text == "Artist • Title • 1999"
+    assert _album(None).spine_text == "Artist • Title"
+
+
+def test_spine_text_follows_edits():
+    album = _album(1999)
+    assert album.spine_text == "Artist • Title • 1999"
+
+    album.artist = "Other Artist"
+    album.title = "Other Title"
+    album.year = None
+
+    assert album.spine_text == "Other Artist • Other Title"
@@ -0,0 +1,120 @@
+"""Rendered PDFs define every named resource their content streams use."""
+
+import base64
+import re
+import zlib
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from cardgen.api.builder import create_card_from_album
+from cardgen.api.models import Album, Track
+from cardgen.config import Theme
+from cardgen.design.cards import JCard4Panel, JCard5Panel
+from cardgen.render import PDFRenderer
+from cardgen.utils.album_art import AlbumArt
+
+_OBJ_RE = re.compile(rb"(\d+) 0 obj\s*(.*?)endobj", re.S)
+_TOKEN_RE = re.compile(rb"<<|>>|\[|\]|\d+ \d+ R\b|/[^\s/\[\]<>()]*|\((?:\\.|[^\\)])*\)|[^\s/\[\]<>()]+")
+
+# Content stream operators that look a resource up by name, per resource category
+_USES = {
+    "ExtGState": re.compile(r"/([^\s/\[\]<>()]+)\s+gs\b"),
+    "XObject": re.compile(r"/([^\s/\[\]<>()]+)\s+Do\b"),
+    "Font": re.compile(r"/([^\s/\[\]<>()]+)\s+[\d.]+\s+Tf\b"),
+}
+
+
+class _Ref(int):
+    """An indirect object reference (N 0 R)."""
+
+
+def _parse(tokens: list[bytes]) -> object:
+    """Parse one PDF value (dicts, arrays, names, references) from the front of tokens."""
+    token = tokens.pop(0)
+    if token == b"<<":
+        result = {}
+        while tokens[0] != b">>":
+            key = tokens.pop(0).decode()[1:]
+            result[key] = _parse(tokens)
+        tokens.pop(0)
+        return result
+    if token == b"[":
+        items = []
+        while tokens[0] != b"]":
+            items.append(_parse(tokens))
+        tokens.pop(0)
+        return items
+    if token.endswith(b" R"):
+        return _Ref(token.split()[0])
+    return token.decode("latin-1")
+
+
+def _objects(pdf: bytes) -> dict[int, tuple[dict, bytes | None]]:
+    """Map object numbers to (dictionary, decoded stream or None)."""
+    objects = {}
+    for match in _OBJ_RE.finditer(pdf):
+        body = match.group(2)
+        head, _, stream = body.partition(b"stream")
+        value = _parse(_TOKEN_RE.findall(head))
+        if not isinstance(value, dict):
+            continue
+        data = None
+        if stream:
+            data = stream.strip()[: -len(b"endstream")].strip()
+            filters = value.get("Filter", [])
+            for name in filters if isinstance(filters, list) else [filters]:
+                if name == "/ASCII85Decode":
+                    data = base64.a85decode(data.removesuffix(b"~>"))
+                elif name == "/FlateDecode":
+                    data = zlib.decompress(data)
+                else:
+                    data = None  # image data; not a content stream
+                    break
+        objects[int(match.group(1))] = (value, data)
+    return objects
+
+
+def _undefined_resources(pdf: bytes) -> list[str]:
+    """List 'object: category/name' for every resource used but not defined."""
+    objects = _objects(pdf)
+
+    def resolve(value: object) -> object:
+        return objects[value][0] if isinstance(value, _Ref) else value
+
+    # Pages (whose content is in /Contents) and form XObjects (content is their own stream)
+    streams = []
+    for number, (value, data) in objects.items():
+        if value.get("Type") == "/Page":
+            streams.append((number, resolve(value["Resources"]), objects[value["Contents"]][1]))
+        elif value.get("Subtype") == "/Form":
+            streams.append((number, resolve(value.get("Resources", {})), data))
+
+    missing = []
+    for number, resources, content in streams:
+        assert content is not None
+        text = content.decode("latin-1")
+        for category, pattern in _USES.items():
+            defined = resolve(resources.get(category, {}))
+            missing += [f"{number}: {category}/{name}" for name in pattern.findall(text) if name not in defined]
+    return missing
+
+
+@pytest.mark.parametrize("card_class", [JCard4Panel, JCard5Panel])
+def test_rendered_pdf_defines_every_resource_it_uses(tmp_path, card_class):
+    buffer = BytesIO()
+    Image.new("RGB", (64, 64), (40, 90, 160)).save(buffer, format="PNG")
+    album = Album(
+        id="test", title="Title", artist="Artist", year=2001, genres=["Shoegaze"], label=None,
+        cover_art=buffer.getvalue(), tracks=[Track(title="Song", duration=240, track_number=1)],
+    )
+    # The Dolby logos are svglib drawings with opacity, which need /ExtGState entries
+    card = create_card_from_album(album, AlbumArt(buffer.getvalue()), card_class, Theme(dolby_logo=True))
+    output = tmp_path / "card.pdf"
+
+    PDFRenderer(dpi=72).render_cards([card, card], output)
+
+    pdf = output.read_bytes()
+    assert b" gs" in b"".join(data or b"" for _, data in _objects(pdf).values())
+    assert _undefined_resources(pdf) == []
@@ -0,0 +1,59 @@
+"""Tape side assignment."""
+
+from cardgen.api.models import Album, Track
+from cardgen.utils import tape
+
+
+def _album(durations: list[int]) -> Album:
+    tracks = [Track(title=f"Track {i}", duration=d, track_number=i) for i, d in enumerate(durations, start=1)]
+    return Album(
+        id="test", title="Title", artist="Artist", year=None, genres=[], label=None, cover_art=b"", tracks=tracks
+    )
+
+
+def _sides(album: Album) -> list[str | None]:
+    return [track.side for track in album.tracks]
+
+
+def test_assign_tape_sides_splits_at_side_capacity():
+    album = _album([600, 600, 600, 600])
+
+    assert album.assign_tape_sides(60) == 1800
+    assert _sides(album) == ["A", "A", "A", "B"]
+
+
+def test_assign_tape_sides_reuses_unchanged_assignment(monkeypatch):
+    album = _album([600, 600, 600, 600])
+    album.assign_tape_sides(60)
+
+    calls = []
+    original = tape.assign_tape_sides
+
+    def counting_assign(tracks: list[Track], tape_length_minutes: int = 90) -> int:
+        calls.append(tape_length_minutes)
+        return original(tracks, tape_length_minutes)
+
+    monkeypatch.setattr(tape, "assign_tape_sides", counting_assign)
+
+    assert album.assign_tape_sides(60) == 1800
+    assert calls == []
+
+
+def test_assign_tape_sides_follows_track_changes():
+    album = _album([600, 600, 600])
+    album.assign_tape_sides(60)
+    assert _sides(album) == ["A", "A", "A"]
+
+    # Appended track
+    album.tracks.append(Track(title="Track 4", duration=600, track_number=4))
+    album.assign_tape_sides(60)
+    assert _sides(album) == ["A", "A", "A", "B"]
+
+    # Changed duration
+    album.tracks[0].duration = 1200
+    album.assign_tape_sides(60)
+    assert _sides(album) == ["A", "A", "B", "B"]
+
+    # Different tape length
+    assert album.assign_tape_sides(90) == 2700
+    assert _sides(album) == ["A", "A", "A", "B"]
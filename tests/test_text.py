@@ -0,0 +1,212 @@
+"""Text wrapping, truncation and block fitting."""
+
+import copy
+from dataclasses import astuple
+from io import BytesIO
+
+import pytest
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen.canvas import Canvas
+
+from cardgen.config import Theme
+from cardgen.design.base import RendererContext
+from cardgen.utils.text import (
+    Line,
+    _calculate_total_height,
+    _process_lines_at_current_size,
+    _split_line_at_word_boundary,
+    _truncate_at_word_boundary,
+    fit_text_block,
+)
+
+FONT = "Helvetica"
+
+TEXTS = [
+    "Symphony No. 5 in C minor, Op. 67: I. Allegro con brio",
+    "la la la la la la la la la la la la",
+    "Supercalifragilisticexpialidocious",
+    "A Supercalifragilisticexpialidocious Word In The Middle",
+    "melancholic, ethereal, lush, atmospheric, melancholic, ethereal, lush",
+    "x",
+]
+WIDTHS = [15.5, 41.3, 77.7, 123.9, 250.1]
+SCALES = [1.0, 0.85, 0.7]
+
+
+def _width(text: str, point_size: float, scale: float) -> float:
+    return pdfmetrics.stringWidth(text, FONT, point_size) * scale
+
+
+def _reference_split(text: str, max_width: float, point_size: float, scale: float, split_max: int) -> tuple[str, ...]:
+    """Greedy wrap measuring every candidate line in full."""
+    words = text.split()
+    lines: list[str] = []
+    current = ""
+    for i, word in enumerate(words):
+        candidate = f"{current} {word}" if current else word
+        if _width(candidate, point_size, scale) <= max_width:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+            current = word
+        else:
+            lines.append(word)
+            current = ""
+        if len(lines) > split_max:
+            current = " ".join(words[i:])
+            break
+    if current:
+        lines.append(current)
+    return tuple(lines)
+
+
+def _reference_truncate(text: str, max_width: float, point_size: float, scale: float) -> str:
+    """Keep the longest word prefix that fits next to the ellipsis, measured in full."""
+    available = max_width - _width("…", point_size, scale)
+    words = text.split()
+    kept = ""
+    for i in range(len(words)):
+        candidate = " ".join(words[: i + 1])
+        if _width(candidate, point_size, scale) > available:
+            break
+        kept = candidate
+    return kept + "…"
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("max_width", WIDTHS)
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("split_max", [1, 2, 15])
+def test_split_matches_direct_measurement(text, max_width, scale, split_max):
+    expected = _reference_split(text, max_width, 10.0, scale, split_max)
+
+    assert _split_line_at_word_boundary(text, max_width, FONT, 10.0, scale, split_max) == expected
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("max_width", WIDTHS)
+@pytest.mark.parametrize("scale", SCALES)
+def test_truncate_matches_direct_measurement(text, max_width, scale):
+    expected = _reference_truncate(text, max_width, 10.0, scale)
+
+    assert _truncate_at_word_boundary(text, max_width, FONT, 10.0, scale) == expected
+
+
+def test_split_puts_an_overwide_word_on_its_own_line():
+    lines = _split_line_at_word_boundary("a Supercalifragilisticexpialidocious b", 40.0, FONT, 10.0, 1.0, 5)
+
+    assert lines == ("a", "Supercalifragilisticexpialidocious", "b")
+
+
+def test_split_repeated_words_respects_width_at_each_size():
+    text = "la la la la la la la la"
+    # Memoized word splitting and widths must not carry over between sizes
+    small = _split_line_at_word_boundary(text, 60.0, FONT, 8.0, 1.0, 15)
+    large = _split_line_at_word_boundary(text, 60.0, FONT, 16.0, 1.0, 15)
+
+    assert len(large) > len(small)
+    for lines, size in ((small, 8.0), (large, 16.0)):
+        assert " ".join(lines) == text
+        assert all(_width(line, size, 1.0) <= 60.0 for line in lines)
+
+
+def test_truncate_overwide_first_word_leaves_only_ellipsis():
+    assert _truncate_at_word_boundary("Supercalifragilisticexpialidocious word", 40.0, FONT, 10.0, 1.0) == "…"
+
+
+def _context() -> RendererContext:
+    return RendererContext(
+        canvas=Canvas(BytesIO()), x=0, y=0, width=200, height=200, theme=Theme(), padding=0, dpi=72
+    )
+
+
+def _lines() -> list[Line]:
+    return [
+        Line(text="Header", point_size=12.0, leading_ratio=0.25, fixed_size=True, font_family="Helvetica-Bold"),
+        Line(text="A fairly long line of track title text", point_size=10.0, leading_ratio=0.125, prefix=" 1. "),
+        Line(text="Short", point_size=10.0, leading_ratio=0.125, suffix=" 3:45"),
+        Line(text="melancholic, ethereal, lush, atmospheric", point_size=10.0, leading_ratio=0.4),
+    ]
+
+
+def _snapshot(lines: list[Line]) -> list[tuple[object, ...]]:
+    return [astuple(line) for line in lines]
+
+
+def _fit(lines: list[Line], max_height: float, **kwargs: float) -> list[Line]:
+    return fit_text_block(None, lines, _context(), max_width=120.0, max_height=max_height, **kwargs)
+
+
+def test_fit_text_block_fits_at_starting_size_without_copies(monkeypatch):
+    copies = []
+    original_copy = copy.copy
+
+    def counting_copy(obj):
+        copies.append(obj)
+        return original_copy(obj)
+
+    monkeypatch.setattr(copy, "copy", counting_copy)
+    lines = _lines()
+
+    fitted = _fit(lines, max_height=500.0)
+
+    assert copies == []
+    assert [line.point_size for line in fitted if line.text == "Short"] == [10.0]
+
+
+def test_fit_text_block_shrinks_until_it_fits():
+    lines = _lines()
+    full_height = sum(line.point_size * (1 + line.leading_ratio) for line in _fit(lines, max_height=500.0))
+
+    fitted = _fit(lines, max_height=full_height * 0.8, min_point_size=1.0)
+
+    heights = sum(line.point_size + line.point_size * line.leading_ratio for line in fitted)
+    assert heights <= full_height * 0.8
+    sizes = {line.text: line.point_size for line in fitted}
+    assert sizes["Header"] == 12.0  # fixed_size lines are never reduced
+    assert sizes["Short"] < 10.0
+
+
+def test_fit_text_block_stops_at_minimum_size():
+    lines = _lines()
+
+    # Can never fit; shrinks to the minimum and returns its best effort
+    fitted = _fit(lines, max_height=1.0, min_point_size=6.0)
+
+    reducible = [line for line in fitted if line.text != "Header"]
+    assert reducible
+    for line in reducible:
+        assert line.point_size <= 6.0
+        assert line.point_size > 6.0 * 0.984375
+
+
+def test_fit_text_block_matches_processing_every_size():
+    # Reference: measure the block at every candidate size
+    def reference(lines: list[Line], max_height: float, min_point_size: float) -> list[Line]:
+        current = [copy.copy(line) for line in lines]
+        while True:
+            processed = _process_lines_at_current_size(current, _context(), 120.0, 0.7, 1)
+            if _calculate_total_height(processed) <= max_height:
+                return processed
+            if min(line.point_size for line in current) <= min_point_size:
+                return processed
+            for line in current:
+                if not line.fixed_size:
+                    line.point_size *= 0.984375
+
+    for max_height in (1.0, 40.0, 55.0, 70.0, 90.0, 500.0):
+        for min_point_size in (4.0, 6.0, 9.0):
+            expected = reference(_lines(), max_height, min_point_size)
+            assert _fit(_lines(), max_height=max_height, min_point_size=min_point_size) == expected
+
+
+@pytest.mark.parametrize("max_height", [1.0, 60.0, 500.0])
+def test_fit_text_block_never_mutates_input_lines(max_height):
+    lines = _lines()
+    before = _snapshot(lines)
+
+    _fit(lines, max_height=max_height)
+    _fit(lines, max_height=max_height)
+
+    assert _snapshot(lines) == before
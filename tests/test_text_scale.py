@@ -0,0 +1,135 @@
+"""Text horizontal scale (Tz) must not leak between drawn text."""
+
+import re
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from reportlab.pdfgen.canvas import Canvas
+
+from cardgen.api.models import Album, Track
+from cardgen.config import Theme
+from cardgen.design.base import RendererContext
+from cardgen.design.sections import CoverSection, DescriptorsSection, GenreTreeSection, TracklistSection
+from cardgen.utils.album_art import AlbumArt
+from cardgen.utils.dimensions import Dimensions
+
+# A text show operator with its string, a Tz operator, or a q/Q state push/pop
+_TOKEN_RE = re.compile(
+    r"\((?P<text>(?:\\.|[^\\)])*)\)\s*Tj"
+    r"|(?P<tz>-?[\d.]+)\s+Tz\b"
+    r"|(?<![\w/])(?P<op>[qQ])(?![\w])"
+)
+
+_LONG_TITLE = "An Extraordinarily Long Track Title That Cannot Possibly Fit On One Line"
+
+
+def _text_scales(c: Canvas) -> dict[str, float]:
+    """Map each string shown on the current page to the Tz in effect when it was drawn."""
+    scales: dict[str, float] = {}
+    stack: list[float] = []
+    tz = 100.0
+    for match in _TOKEN_RE.finditer(c.getCurrentPageContent()):
+        if match.group("text") is not None:
+            scales[match.group("text")] = tz
+        elif match.group("tz") is not None:
+            tz = float(match.group("tz"))
+        elif match.group("op") == "q":
+            stack.append(tz)
+        else:
+            tz = stack.pop()
+    return scales
+
+
+def _leak_scale(c: Canvas) -> None:
+    """Leave a compressed Tz behind, as a misbehaving earlier section would."""
+    text = c.beginText(0, 0)
+    text.setHorizScale(50)
+    text.textOut("leak")
+    c.drawText(text)
+
+
+def _context(c: Canvas, width: float = 288, height: float = 288) -> RendererContext:
+    return RendererContext(
+        canvas=c, x=0, y=0, width=width, height=height, theme=Theme(), padding=7.2, dpi=72
+    )
+
+
+def _album() -> Album:
+    return Album(
+        id="test",
+        title="Title",
+        artist="Artist",
+        year=2001,
+        genres=["Shoegaze", "Dream Pop"],
+        label="Label",
+        cover_art=b"",
+        tracks=[],
+        rym_descriptors=["melancholic", "ethereal", "lush", "atmospheric"],
+    )
+
+
+@pytest.fixture
+def canvas(tmp_path):
+    return Canvas(str(tmp_path / "out.pdf"), pageCompression=0)
+
+
+def test_tracklist_compressed_title_does_not_squeeze_later_text(canvas):
+    tracks = [
+        Track(title=_LONG_TITLE, duration=200, track_number=1, side="A"),
+        Track(title="Short 2", duration=180, track_number=2, side="A"),
+        Track(title="Short 3", duration=180, track_number=3, side="B"),
+    ]
+    section = TracklistSection("inside", Dimensions(width=2.5, height=4.0), tracks, side_capacity=2700)
+    section.render(_context(canvas, width=180, height=288))
+    canvas.drawString(0, 0, "after")
+
+    scales = _text_scales(canvas)
+    # The long title is compressed...
+    assert scales["An Extraordinarily Long Track Title"] < 100
+    # ...but its duration and everything drawn after it are not
+    for text in (" 3:20", " 2. ", "Short 2", " 3:00", "Side B", "Short 3", "after"):
+        assert scales[text] == 100, text
+
+
+@pytest.mark.parametrize("section_class", [GenreTreeSection, DescriptorsSection])
+def test_panel_text_does_not_inherit_scale(canvas, section_class):
+    section = section_class("panel", Dimensions(width=3.0, height=3.0), _album(), font_size=10.0)
+    _leak_scale(canvas)
+    # Wide enough that nothing needs compressing
+    section.render(_context(canvas, width=216, height=216))
+
+    scales = _text_scales(canvas)
+    assert scales.pop("leak") == 50
+    assert scales
+    assert all(scale == 100 for scale in scales.values()), scales
+
+
+@pytest.mark.parametrize("section_class", [GenreTreeSection, DescriptorsSection])
+def test_panel_text_does_not_leak_scale(canvas, section_class):
+    section = section_class("panel", Dimensions(width=1.0, height=5.0), _album(), font_size=10.0)
+    # Narrow enough that lines are compressed
+    section.render(_context(canvas, width=72, height=400))
+    canvas.drawString(0, 0, "after")
+
+    scales = _text_scales(canvas)
+    assert min(scales.values()) < 100
+    assert scales["after"] == 100
+
+
+def test_cover_compressed_artist_does_not_leak_scale(canvas):
+    buffer = BytesIO()
+    Image.new("RGB", (64, 64), (200, 30, 30)).save(buffer, format="PNG")
+    section = CoverSection(
+        "front",
+        Dimensions(width=2.0, height=2.5),
+        AlbumArt(buffer.getvalue()),
+        title="Title",
+        artist="An Artist Name Long Enough To Need Horizontal Compression",
+    )
+    section.render(_context(canvas, width=144, height=300))
+    canvas.drawString(0, 0, "after")
+
+    scales = _text_scales(canvas)
+    assert min(scales.values()) < 100
+    assert scales["after"] == 100